@@ -4,6 +4,7 @@
 #include <vector>
 #include <cstddef>
 #include <variant>
+#include <optional>
 
 #include "compressed/macros.h"
 #include "compressed/blosc2/util.h"
@@ -337,6 +338,33 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 				return _size;
 			}
 
+			/// Retrieve the value of the lazy-schunk if all of its chunks are still lazy and share the same value,
+			/// i.e. the whole schunk represents a single constant value. Returns std::nullopt if any chunk holds
+			/// compressed data or if the schunk is empty.
+			std::optional<T> lazy_constant() const noexcept
+			{
+				if (this->m_Chunks.empty())
+				{
+					return std::nullopt;
+				}
+
+				const auto& first = this->m_Chunks.front();
+				if (!first.is_lazy())
+				{
+					return std::nullopt;
+				}
+
+				const T value = std::get<T>(first.value);
+				for (const auto& chunk : this->m_Chunks)
+				{
+					if (!chunk.is_lazy() || !(std::get<T>(chunk.value) == value))
+					{
+						return std::nullopt;
+					}
+				}
+				return value;
+			}
+
 		private:
 
 			/// Check whether this->m_Chunks contain any still-lazy chunks.
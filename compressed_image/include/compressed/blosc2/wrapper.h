@@ -1,6 +1,8 @@
 #pragma once
 
 #include <memory>
+#include <optional>
+#include <cstring>
 
 #include "compressed/macros.h"
 #include "compressed/enums.h"
@@ -118,6 +120,63 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 			return enums::codec::blosclz;
 		}
 	
+		namespace detail
+		{
+
+			/// Check whether all elements in `data` are bitwise identical. 
+			/// 
+			/// Rather than comparing element by element, this compares the buffer against itself shifted by one element. 
+			/// If every byte equals the byte sizeof(T) positions after it, all the elements must be identical. This 
+			/// allows us to defer to memcmp which is vectorized on all major platforms and exits on the first mismatch.
+			/// Comparing bytes rather than values also ensures we don't treat e.g. -0.0f and 0.0f as identical.
+			template <typename T>
+			bool is_repeated_value(std::span<const T> data) noexcept
+			{
+				if (data.size() < 2)
+				{
+					return false;
+				}
+				const auto bytes = reinterpret_cast<const std::byte*>(data.data());
+				return std::memcmp(bytes, bytes + sizeof(T), (data.size() - 1) * sizeof(T)) == 0;
+			}
+
+			/// Try to compress `data` as a blosc2 special chunk, storing only a single repeated value rather than 
+			/// going through the compressor. These chunks are handled natively by blosc2 on decompression so they
+			/// require no special treatment on our end.
+			/// 
+			/// \returns The compressed byte size of the chunk or std::nullopt if the data is not a single repeated
+			///          value (or the context doesn't match T) in which case the regular compression should be used.
+			/// \throws std::runtime_error if the creation of the special chunk fails.
+			template <typename T>
+			std::optional<size_t> compress_repeated_value(context_raw_ptr context, std::span<const T> data, std::span<std::byte> chunk)
+			{
+				if (!is_repeated_value(data))
+				{
+					return std::nullopt;
+				}
+
+				blosc2_cparams cparams = BLOSC2_CPARAMS_DEFAULTS;
+				if (blosc2_ctx_get_cparams(context, &cparams) < 0 || cparams.typesize != static_cast<int32_t>(sizeof(T)))
+				{
+					return std::nullopt;
+				}
+
+				const auto cbytes = blosc2_chunk_repeatval(
+					cparams,
+					static_cast<int32_t>(data.size() * sizeof(T)),
+					static_cast<void*>(chunk.data()),
+					static_cast<int32_t>(chunk.size()),
+					static_cast<const void*>(data.data())
+				);
+				if (cbytes < 0)
+				{
+					throw std::runtime_error(std::format("Unable to create repeated value chunk using Blosc2 with error code {}", cbytes));
+				}
+				return static_cast<size_t>(cbytes);
+			}
+
+		} // detail
+
 		/// Compress the `data` into `chunk` using the provided `context`. 
 		/// 
 		/// This function applies Blosc2 compression to the input `data` and stores the compressed 
@@ -136,6 +195,11 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 		{
 			_COMPRESSED_PROFILE_FUNCTION();
 			detail::init_filters();
+			if (auto cbytes = detail::compress_repeated_value(context, std::span<const T>(data), chunk))
+			{
+				return cbytes.value();
+			}
+
 			const auto cbytes = blosc2_compress_ctx(
 				context,
 				static_cast<const void*>(data.data()),
@@ -169,6 +233,11 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 		{
 			_COMPRESSED_PROFILE_FUNCTION();
 			detail::init_filters();
+			if (auto cbytes = detail::compress_repeated_value(context, data, chunk))
+			{
+				return cbytes.value();
+			}
+
 			const auto cbytes = blosc2_compress_ctx(
 				context,
 				static_cast<const void*>(data.data()),
@@ -537,6 +537,28 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 				}, *m_Schunk);
 		}
 
+		/// Fill the whole channel with the given value.
+		///
+		/// This discards all of the currently stored chunks and turns the channel into a lazy-channel storing only
+		/// `value` per-chunk. The chunk and block size are preserved. This is significantly cheaper than iterating
+		/// all chunks and setting them one by one as no compression takes place.
+		///
+		/// \param value The value to fill the channel with.
+		///
+		/// \throws std::runtime_error if the internal `schunk` pointer is not initialized.
+		void fill(T value)
+		{
+			_COMPRESSED_PROFILE_FUNCTION();
+			if (!m_Schunk)
+			{
+				throw std::runtime_error("Internal Error: Channel instance is not properly initialized, unable to set data");
+			}
+
+			const size_t block_size = this->block_size();
+			const size_t chunk_size = this->chunk_size();
+			*m_Schunk = blosc2::lazy_schunk<T>(value, m_Width * m_Height, block_size, chunk_size);
+		}
+
 		/// Get the decompressed data as a vector.
 		///
 		/// \throws std::runtime_error if the internal `schunk` pointer is not initialized.
@@ -548,6 +570,13 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 			{
 				throw std::runtime_error("Internal Error: Channel instance is not properly initialized, unable to get decompressed data");
 			}
+
+			// If the channel represents a single value we can skip setting up the decompression entirely.
+			if (auto value = this->lazy_constant())
+			{
+				return std::vector<T>(m_Width * m_Height, value.value());
+			}
+
 			return std::visit([&](const auto& schunk)
 				{
 					// We cheat a little bit here by creating this compression ctx on the fly, unfortunately this is 
@@ -557,6 +586,21 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 				}, *m_Schunk);
 		}
 
+		/// Retrieve the value of the channel if it is a lazy-channel whose chunks are all still lazy and share the
+		/// same value (e.g. after `full`, `zeros` or `fill` with no chunks having been modified since).
+		///
+		/// This allows callers to skip decompression entirely for constant channels.
+		///
+		/// \return The constant value of the channel or std::nullopt if the channel holds any compressed data.
+		std::optional<T> lazy_constant() const noexcept
+		{
+			if (!m_Schunk || !std::holds_alternative<blosc2::lazy_schunk<T>>(*m_Schunk))
+			{
+				return std::nullopt;
+			}
+			return std::get<blosc2::lazy_schunk<T>>(*m_Schunk).lazy_constant();
+		}
+
 		/// Equality operators, compares pointers to check for equality
 		bool operator==(const channel<T>& other) const noexcept
 		{
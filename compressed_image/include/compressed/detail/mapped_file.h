@@ -0,0 +1,232 @@
+#pragma once
+
+#include <span>
+#include <cstddef>
+#include <filesystem>
+#include <stdexcept>
+#include <format>
+#include <utility>
+
+#include "compressed/macros.h"
+
+#ifdef _WIN32
+// Keep Windows.h from defining min/max macros and pulling in rarely used APIs, we undefine these again after the 
+// include so they don't leak into the including translation unit.
+#ifndef NOMINMAX
+#define NOMINMAX
+#define _COMPRESSED_UNDEF_NOMINMAX
+#endif
+#ifndef WIN32_LEAN_AND_MEAN
+#define WIN32_LEAN_AND_MEAN
+#define _COMPRESSED_UNDEF_WIN32_LEAN_AND_MEAN
+#endif
+#include <Windows.h>
+#ifdef _COMPRESSED_UNDEF_NOMINMAX
+#undef NOMINMAX
+#undef _COMPRESSED_UNDEF_NOMINMAX
+#endif
+#ifdef _COMPRESSED_UNDEF_WIN32_LEAN_AND_MEAN
+#undef WIN32_LEAN_AND_MEAN
+#undef _COMPRESSED_UNDEF_WIN32_LEAN_AND_MEAN
+#endif
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+namespace NAMESPACE_COMPRESSED_IMAGE
+{
+
+    namespace detail
+    {
+
+        /// \brief Read-only memory mapping of a file on disk.
+        ///
+        /// The file contents are paged in by the OS on access and may be evicted again under memory pressure,
+        /// this means that reading from the mapping never requires holding the whole file in memory at once.
+        /// The mapping is released on destruction, any spans retrieved via `data()` are invalidated at that point.
+        struct mapped_file
+        {
+            mapped_file() = default;
+
+            /// Map the file at the given path into memory.
+            ///
+            /// \param filepath The file to map.
+            ///
+            /// \throws std::invalid_argument if the file cannot be opened.
+            /// \throws std::runtime_error if the file cannot be mapped.
+            explicit mapped_file(const std::filesystem::path& filepath)
+            {
+#ifdef _WIN32
+                m_File = ::CreateFileW(
+                    filepath.c_str(),
+                    GENERIC_READ,
+                    FILE_SHARE_READ,
+                    nullptr,
+                    OPEN_EXISTING,
+                    FILE_ATTRIBUTE_NORMAL | FILE_FLAG_SEQUENTIAL_SCAN,
+                    nullptr
+                );
+                if (m_File == INVALID_HANDLE_VALUE)
+                {
+                    throw std::invalid_argument(std::format("File {} does not exist on disk", filepath.string()));
+                }
+
+                LARGE_INTEGER file_size{};
+                if (!::GetFileSizeEx(m_File, &file_size))
+                {
+                    this->close();
+                    throw std::runtime_error(std::format("Unable to query the file size of {}", filepath.string()));
+                }
+                m_Size = static_cast<size_t>(file_size.QuadPart);
+
+                // Mapping an empty file is an error on windows so we simply leave the mapping empty.
+                if (m_Size == 0)
+                {
+                    return;
+                }
+
+                m_Mapping = ::CreateFileMappingW(m_File, nullptr, PAGE_READONLY, 0, 0, nullptr);
+                if (m_Mapping == nullptr)
+                {
+                    this->close();
+                    throw std::runtime_error(std::format("Unable to memory-map file {}", filepath.string()));
+                }
+
+                m_Data = ::MapViewOfFile(m_Mapping, FILE_MAP_READ, 0, 0, 0);
+                if (m_Data == nullptr)
+                {
+                    this->close();
+                    throw std::runtime_error(std::format("Unable to memory-map file {}", filepath.string()));
+                }
+#else
+                m_File = ::open(filepath.c_str(), O_RDONLY);
+                if (m_File == -1)
+                {
+                    throw std::invalid_argument(std::format("File {} does not exist on disk", filepath.string()));
+                }
+
+                struct stat file_stat{};
+                if (::fstat(m_File, &file_stat) == -1)
+                {
+                    this->close();
+                    throw std::runtime_error(std::format("Unable to query the file size of {}", filepath.string()));
+                }
+                m_Size = static_cast<size_t>(file_stat.st_size);
+
+                // Mapping an empty file is an error so we simply leave the mapping empty.
+                if (m_Size == 0)
+                {
+                    return;
+                }
+
+                void* data = ::mmap(nullptr, m_Size, PROT_READ, MAP_PRIVATE, m_File, 0);
+                if (data == MAP_FAILED)
+                {
+                    this->close();
+                    throw std::runtime_error(std::format("Unable to memory-map file {}", filepath.string()));
+                }
+                m_Data = data;
+
+                // We (and OIIO) will typically read the file front-to-back, hint this to the kernel so it can read
+                // ahead more aggressively and drop pages behind us. This is purely a hint so we ignore failures.
+                ::madvise(m_Data, m_Size, MADV_SEQUENTIAL);
+#endif
+            }
+
+            mapped_file(const mapped_file&) = delete;
+            mapped_file& operator=(const mapped_file&) = delete;
+
+            mapped_file(mapped_file&& other) noexcept
+            {
+                this->swap(other);
+            }
+            mapped_file& operator=(mapped_file&& other) noexcept
+            {
+                if (this != &other)
+                {
+                    this->close();
+                    this->swap(other);
+                }
+                return *this;
+            }
+
+            ~mapped_file()
+            {
+                this->close();
+            }
+
+            /// The mapped file contents, empty if the file is empty.
+            std::span<const std::byte> data() const noexcept
+            {
+                if (m_Data == nullptr)
+                {
+                    return {};
+                }
+                return std::span<const std::byte>(static_cast<const std::byte*>(m_Data), m_Size);
+            }
+
+            /// The size of the mapped file in bytes.
+            size_t size() const noexcept
+            {
+                return m_Size;
+            }
+
+        private:
+#ifdef _WIN32
+            HANDLE m_File = INVALID_HANDLE_VALUE;
+            HANDLE m_Mapping = nullptr;
+#else
+            int m_File = -1;
+#endif
+            void* m_Data = nullptr;
+            size_t m_Size = 0;
+
+            void swap(mapped_file& other) noexcept
+            {
+                std::swap(m_File, other.m_File);
+#ifdef _WIN32
+                std::swap(m_Mapping, other.m_Mapping);
+#endif
+                std::swap(m_Data, other.m_Data);
+                std::swap(m_Size, other.m_Size);
+            }
+
+            void close() noexcept
+            {
+#ifdef _WIN32
+                if (m_Data != nullptr)
+                {
+                    ::UnmapViewOfFile(m_Data);
+                }
+                if (m_Mapping != nullptr)
+                {
+                    ::CloseHandle(m_Mapping);
+                }
+                if (m_File != INVALID_HANDLE_VALUE)
+                {
+                    ::CloseHandle(m_File);
+                }
+                m_Mapping = nullptr;
+                m_File = INVALID_HANDLE_VALUE;
+#else
+                if (m_Data != nullptr)
+                {
+                    ::munmap(m_Data, m_Size);
+                }
+                if (m_File != -1)
+                {
+                    ::close(m_File);
+                }
+                m_File = -1;
+#endif
+                m_Data = nullptr;
+                m_Size = 0;
+            }
+        };
+
+    } // detail
+
+} // NAMESPACE_COMPRESSED_IMAGE
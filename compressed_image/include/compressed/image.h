@@ -15,6 +15,7 @@
 
 #ifdef COMPRESSED_IMAGE_OIIO_AVAILABLE
 #include <OpenImageIO/imageio.h>
+#include <OpenImageIO/filesystem.h>
 #endif
 
 #include "macros.h"
@@ -29,6 +30,11 @@
 #include "detail/oiio_util.h"
 #include "detail/scoped_timer.h"
 
+// Only required by read_mmap(), this pulls in platform headers so we avoid exposing these when not needed.
+#ifdef COMPRESSED_IMAGE_OIIO_AVAILABLE
+#include "detail/mapped_file.h"
+#endif
+
 #include "iterators/iterator.h"
 
 namespace NAMESPACE_COMPRESSED_IMAGE 
@@ -396,6 +402,98 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 			);
 		}
 
+		/// \brief Reads a compressed image from a memory-mapped file using OpenImageIO and compresses it during reading.
+		/// 
+		/// Requires CompressedImage to have been compiled with OpenImageIO support.
+		/// 
+		/// Behaves identically to `read` but rather than having OpenImageIO read the file through regular file I/O
+		/// the file is memory-mapped and handed to OpenImageIO as an in-memory buffer. The OS will page in the file
+		/// on demand and is free to evict these pages again under memory pressure so this never requires holding
+		/// the whole file in memory at once. This is mostly beneficial for very large files, for small files the
+		/// difference to `read` is negligible.
+		/// 
+		/// Note that access is now bounded by page-fault latency rather than by sequential reads so if the file lives
+		/// on e.g. a network drive, `read` may be the better choice.
+		/// 
+		/// If the file format does not support reading from memory we transparently fall back to `read`.
+		/// 
+		/// Example:
+		/// \code{.cpp}
+		/// std::filesystem::path filepath = "image.exr";
+		/// auto img = compressed::image::read_mmap<uint8_t>(filepath, 0, compressed::enums::codec::lz4, 5);
+		/// \endcode
+		///
+		/// \param filepath The file path of the image to read.
+		/// \param subimage The subimage to extract the channels from (default: 0). Only relevant for multi-part images.
+		/// \param compression_codec The compression codec to use (default: LZ4).
+		/// \param compression_level The compression level (default: 9).
+		/// \param block_size The size of the blocks stored inside the chunks, defaults to 32KB which is enough to 
+		///					  comfortably fit into the L1 cache of most modern CPUs. If you know your cpu can handle 
+		///					  larger blocks feel free to up this number.
+		/// \param chunk_size The size of each individual chunk, defaults to 4MB which is enough to hold a 2048x2048 channel. 
+		///					  This should be tweaked to be no larger than the size of the usual images you are expecting  
+		///					  to compress for optimal performance but this could be upped which might give better compression
+		///					  ratios. Must be a multiple of sizeof(T).
+		/// \return A compressed image instance.
+		static image read_mmap(
+			std::filesystem::path filepath,
+			int subimage = 0,
+			enums::codec compression_codec = enums::codec::lz4,
+			size_t compression_level = 9,
+			size_t block_size = s_default_blocksize,
+			size_t chunk_size = s_default_chunksize
+		)
+		{
+			_COMPRESSED_PROFILE_FUNCTION();
+
+			// Not all formats support reading from an IOProxy, for these we just go through the regular read.
+			{
+				auto probe_ptr = OIIO::ImageInput::create(filepath.string());
+				if (!probe_ptr || !probe_ptr->supports("ioproxy"))
+				{
+					return image<T>::read(filepath, subimage, compression_codec, compression_level, block_size, chunk_size);
+				}
+			}
+
+			// Both the mapping and the proxy must outlive the ImageInput, which is guaranteed as `read` consumes
+			// (and destroys) the input before returning.
+			auto mapping = detail::mapped_file(filepath);
+			auto data = mapping.data();
+			auto proxy = OIIO::Filesystem::IOMemReader(
+				OIIO::cspan<unsigned char>(reinterpret_cast<const unsigned char*>(data.data()), data.size())
+			);
+
+			auto input_ptr = OIIO::ImageInput::open(filepath.string(), nullptr, &proxy);
+			if (!input_ptr)
+			{
+				throw std::invalid_argument(
+					std::format("Unable to open file {} for reading: {}", filepath.string(), OIIO::geterror())
+				);
+			}
+
+			// Ensure we seek to the right subimage before retrieving the spec as it is subimage dependent.
+			auto res = input_ptr->seek_subimage(subimage, 0);
+			if (!res)
+			{
+				throw std::invalid_argument(
+					std::format(
+						"File '{}' does not have a subimage {}, cannot seek to it", filepath.string(), subimage
+					)
+				);
+			}
+			const OIIO::ImageSpec& spec = input_ptr->spec();
+
+			return image<T>::read(
+				std::move(input_ptr),
+				spec.channelnames,
+				subimage,
+				compression_codec,
+				compression_level,
+				block_size,
+				chunk_size
+			);
+		}
+
 		/// \brief Reads a compressed image from a file using OpenImageIO and compresses it during reading.
 		/// 
 		/// Requires CompressedImage to have been compiled with OpenImageIO support.
@@ -1040,6 +1138,187 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 			));
 		}
 
+		/// Adds a lazy-channel filled with `fill_value` to the image.
+		/// 
+		/// The channel takes on the width and height of the image and only stores a single value per-chunk, no 
+		/// dense buffer is ever allocated or compressed. See `channel<T>::full` for more details.
+		/// 
+		/// Example:
+		/// \code{.cpp}
+		/// my_image.add_channel_full(255, "alpha");
+		/// \endcode
+		/// 
+		/// \param fill_value The value to fill the channel with.
+		/// \param name (Optional) Channel name of the channel to be inserted. If no channel names are set this argument is ignored.
+		/// \param compression_codec (Optional) Compression codec to apply to the channel, every channel is allowed to have a different one.
+		/// \param compression_level (Optional) Compression level, defaults to 9.
+		/// \param block_size (Optional) The block size of the channel, defaults to s_default_blocksize.
+		/// \param chunk_size (Optional) The chunk size of the channel, defaults to s_default_chunksize.
+		void add_channel_full(
+			T fill_value,
+			std::optional<std::string> name = std::nullopt,
+			enums::codec compression_codec = enums::codec::lz4,
+			uint8_t compression_level = 9,
+			size_t block_size = s_default_blocksize,
+			size_t chunk_size = s_default_chunksize
+		)
+		{
+			this->add_channel(
+				compressed::channel<T>::full(
+					this->width(),
+					this->height(),
+					fill_value,
+					compression_codec,
+					compression_level,
+					block_size,
+					chunk_size
+				),
+				std::move(name)
+			);
+		}
+
+		/// Adds multiple channels to the image.
+		/// 
+		/// This is equivalent to calling `add_channel` for each of the channels but all of them are compressed first
+		/// (see `compress_channels`). The channels are only inserted once all of them were compressed successfully, 
+		/// if any of them fails the image is left unmodified.
+		/// 
+		/// Example:
+		/// \code{.cpp}
+		/// std::vector<std::span<const T>> channels = ...;
+		/// my_image.add_channels(channels, 1920, 1080, { "R", "G", "B" });
+		/// \endcode
+		/// 
+		/// \param data The channels to be added to the image, each of these must be `width * height` elements.
+		/// \param width The width of the channels
+		/// \param height The height of the channels
+		/// \param names (Optional) Channel names of the channels to be inserted, if specified these must match the number
+		///				 of channels. If no channel names are set on the image this argument is ignored.
+		/// \param compression_codec (Optional) Compression codec to apply to the channels.
+		/// \param compression_level (Optional) Compression level, defaults to 9.
+		/// \param block_size (Optional) The block size of the channels, defaults to s_default_blocksize.
+		/// \param chunk_size (Optional) The chunk size of the channels, defaults to s_default_chunksize.
+		/// 
+		/// \throws std::invalid_argument if the dimensions, number of elements or number of names do not match.
+		/// \throws std::runtime_error if a channel fails to be compressed.
+		void add_channels(
+			const std::vector<std::span<const T>>& data,
+			size_t width,
+			size_t height,
+			const std::vector<std::string>& names = {},
+			enums::codec compression_codec = enums::codec::lz4,
+			uint8_t compression_level = 9,
+			size_t block_size = s_default_blocksize,
+			size_t chunk_size = s_default_chunksize
+		)
+		{
+			_COMPRESSED_PROFILE_FUNCTION();
+			// Validate up-front so we don't compress all the channels only to then discard them.
+			this->validate_new_channels(data.size(), width, height, names);
+			this->add_channels(
+				compress_channels(data, width, height, compression_codec, compression_level, block_size, chunk_size),
+				names
+			);
+		}
+
+		/// Adds multiple already compressed channels to the image.
+		/// 
+		/// All channels are validated before any of them are inserted, if any of them doesn't match the image, the 
+		/// image is left unmodified.
+		/// 
+		/// \param channels The channels to be added to the image.
+		/// \param names (Optional) Channel names of the channels to be inserted, if specified these must match the number
+		///				 of channels. If no channel names are set on the image this argument is ignored.
+		/// 
+		/// \throws std::invalid_argument if the dimensions or number of names do not match.
+		void add_channels(std::vector<compressed::channel<T>> channels, const std::vector<std::string>& names = {})
+		{
+			this->validate_new_channels(channels.size(), this->width(), this->height(), names);
+			for (const auto& _channel : channels)
+			{
+				this->validate_new_channels(channels.size(), _channel.width(), _channel.height(), names);
+			}
+			for (size_t i = 0; i < channels.size(); ++i)
+			{
+				this->add_channel(
+					std::move(channels[i]), 
+					names.empty() ? std::nullopt : std::optional<std::string>(names[i])
+				);
+			}
+		}
+
+		/// Compresses multiple channels without adding them to any image. Each channel is compressed using 
+		/// multiple threads.
+		/// 
+		/// This does not touch any image state so it may be run concurrently with other operations, e.g. while
+		/// not holding a lock on the image, before passing the result to `add_channels`.
+		/// 
+		/// \param data The channels to be compressed, each of these must be `width * height` elements.
+		/// \param width The width of the channels
+		/// \param height The height of the channels
+		/// \param compression_codec (Optional) Compression codec to apply to the channels.
+		/// \param compression_level (Optional) Compression level, defaults to 9.
+		/// \param block_size (Optional) The block size of the channels, defaults to s_default_blocksize.
+		/// \param chunk_size (Optional) The chunk size of the channels, defaults to s_default_chunksize.
+		/// 
+		/// \throws std::invalid_argument if the number of elements of a channel does not match `width * height`.
+		/// \throws std::runtime_error if a channel fails to be compressed.
+		/// 
+		/// \return The compressed channels in the same order as `data`.
+		static std::vector<compressed::channel<T>> compress_channels(
+			const std::vector<std::span<const T>>& data,
+			size_t width,
+			size_t height,
+			enums::codec compression_codec = enums::codec::lz4,
+			uint8_t compression_level = 9,
+			size_t block_size = s_default_blocksize,
+			size_t chunk_size = s_default_chunksize
+		)
+		{
+			_COMPRESSED_PROFILE_FUNCTION();
+			for (size_t i = 0; i < data.size(); ++i)
+			{
+				if (data[i].size() != width * height)
+				{
+					throw std::invalid_argument(
+						std::format(
+							"Cannot compress channel at position {} as its size does not match its dimensions."
+							" Expected {:L} elements but instead got {:L} elements",
+							i, width * height, data[i].size()
+						)
+					);
+				}
+			}
+
+			// Each channel already compresses its chunks across multiple threads through its blosc2 context so we 
+			// go through the channels one after the other, compressing them in parallel as well would oversubscribe
+			// the cpu.
+			std::vector<compressed::channel<T>> channels;
+			channels.reserve(data.size());
+			for (size_t i = 0; i < data.size(); ++i)
+			{
+				try
+				{
+					channels.push_back(compressed::channel<T>(
+						data[i],
+						width,
+						height,
+						compression_codec,
+						compression_level,
+						block_size,
+						chunk_size
+					));
+				}
+				catch (const std::exception& e)
+				{
+					throw std::runtime_error(
+						std::format("Failed to compress channel at position {}. Full error: \n{}", i, e.what())
+					);
+				}
+			}
+			return channels;
+		}
+
 
 		/// Remove a channel by its index.
 		/// 
@@ -1463,6 +1742,33 @@ namespace NAMESPACE_COMPRESSED_IMAGE
 
 	private:
 
+		/// Validate that `num_channels` channels with the given dimensions and names may be added to the image.
+		/// 
+		/// \throws std::invalid_argument if the dimensions or number of names do not match.
+		void validate_new_channels(size_t num_channels, size_t width, size_t height, const std::vector<std::string>& names) const
+		{
+			if (!names.empty() && names.size() != num_channels)
+			{
+				throw std::invalid_argument(
+					std::format(
+						"Cannot add channels to the image as the number of names does not match the number of channels."
+						" Expected {} names but instead got {}",
+						num_channels, names.size()
+					)
+				);
+			}
+			if (width != this->width() || height != this->height())
+			{
+				throw std::invalid_argument(
+					std::format(
+						"Cannot add channels to the image as their dimensions do not match that of the image."
+						" Expected {:L}x{:L} pixels but instead got {:L}x{:L} pixels",
+						this->width(), this->height(), width, height
+					)
+				);
+			}
+		}
+
 
 // Implementations for the read() functions.
 // -----------------------------------------------------------------------------------
@@ -1,22 +1,22 @@
-import os
+import pathlib
 
 import compressed_image as compressed
 import numpy as np
 
 
-filepath = os.path.join(os.path.dirname(__file__), "images/uv_grid_2048x2048.jpg")
+filepath = pathlib.Path(__file__).resolve().parent / "images" / "uv_grid_2048x2048.jpg"
 
 # Read the image in chunks without having to load the whole file into memory, this is roughly as fast 
 # or only slightly slower than reading the image data raw through OpenImageIO while taking only a fraction
-# of the memory.
-image = compressed.Image.read(np.uint8, filepath, subimage=0)
+# of the memory. read_mmap additionally memory-maps the source file so the OS pages it in on demand rather
+# than it being read into memory, for very large files this keeps the memory usage low even while decoding.
+image = compressed.Image.read_mmap(np.uint8, str(filepath), subimage=0)
 
 # Now that we have the image, we might want to add another channel into the mix, (note that block and chunk size
-# must be identical!):
-image.add_channel(
-	np.full((image.height, image.width), 255, np.uint8), 
-	image.width, 
-	image.height,
+# must be identical!). Since this channel holds a single value we can add it as a lazy-channel which never 
+# allocates or compresses the full-size data. To add a channel from existing data use `image.add_channel`.
+image.add_channel_full(
+	255,
 	"Z",
 	compressed.Codec.zstd, # compression codec, channels within an image may have different compression codecs
 	5,	# compression level, this may be different across channels in the image
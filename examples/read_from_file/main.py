@@ -1,26 +1,44 @@
-import os
+import pathlib
 
 import compressed_image as compressed
 import numpy as np
 
 
-filepath = os.path.join(os.path.dirname(__file__), "images/uv_grid_2048x2048.jpg")
+filepath = pathlib.Path(__file__).resolve().parent / "images" / "uv_grid_2048x2048.jpg"
 
 # Read the image in chunks without having to load the whole file into memory, this is roughly as fast 
 # or only slightly slower than reading the image data raw through OpenImageIO while taking only a fraction
-# of the memory.
-image = compressed.Image.read(np.uint8, filepath, subimage=0)
+# of the memory. read_mmap additionally memory-maps the source file so the OS pages it in on demand rather
+# than it being read into memory, for very large files this keeps the memory usage low even while decoding.
+image = compressed.Image.read_mmap(np.uint8, str(filepath), subimage=0)
 
 # Get references to the channels, to get a list of all channels use get_channel_names
 r = image.channel("R")
 g = image.channel("G")
 b = image.channel("B")
 
-# Now iterate e.g. channel r and modify its value (it is perfectly valid to modify multiple
-# channels at once but for demonstration purposes we only modify one).
-for chunk_index in range(r.num_chunks()):
-    chunk_r = r.get_chunk(chunk_index)
+# Setting a whole channel to a single value doesn't require iterating the chunks at all, this discards
+# the current data and only stores the value once per-chunk.
+r.fill(25)
 
-    chunk_r[:] = 25
+# For more involved modifications, map_chunks will call the function on every chunk (as a 1D numpy array)
+# reusing a single buffer internally. The chunk should be modified in-place and is written back once
+# the function returns.
+def invert(chunk: np.ndarray):
+    np.subtract(255, chunk, out=chunk)
 
-    r.set_chunk(chunk_index, chunk_r)
\ No newline at end of file
+g.map_chunks(invert)
+
+# If you need to iterate the chunks yourself, allocate a single buffer up front and decompress into it rather
+# than having get_chunk allocate a new array on every iteration. All chunks except for the last are guaranteed
+# to be the same size so we can simply slice the buffer to the chunk's size. The chunk writer caches the
+# channel's dtype and chunk layout so writing the chunks back doesn't have to re-query these every time.
+buffer = np.empty((b.chunk_elems(),), dtype=b.dtype)
+writer_b = b.chunk_writer()
+for chunk_index in range(b.num_chunks()):
+    chunk_b = buffer[:b.chunk_elems(chunk_index)]
+    b.get_chunk(chunk_index, chunk_b)
+
+    np.minimum(chunk_b, 128, out=chunk_b)
+
+    writer_b(chunk_index, chunk_b)
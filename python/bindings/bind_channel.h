@@ -14,6 +14,23 @@ namespace compressed_py
     void bind_compressed_channel(py::module_& m)
     {
 
+        py::class_<compressed_py::chunk_writer>(m, "ChunkWriter", R"doc(
+A writer bound to a single `compressed_image.Channel`, created via `Channel.chunk_writer()`.
+
+The dtype and chunk layout of the channel are cached on creation so writing a chunk only has to validate the 
+passed array against these. This is the preferred way of setting many chunks in a loop. 
+
+The writer must not be used anymore after the channel has been reshaped.
+        )doc")
+            .def("__call__", &compressed_py::chunk_writer::operator(),
+                py::arg("chunk_index"), py::arg("array"),
+                R"doc(
+Compress the array into the chunk at `chunk_index`. 
+
+:param chunk_index: Index of the chunk to update. Must be less than channel.num_chunks()
+:param array: 1D, C-contiguous numpy array of size `channel.chunk_elems(chunk_index)` with the channel's dtype.
+            )doc");
+
         py::class_<compressed_py::dynamic_channel, std::shared_ptr<compressed_py::dynamic_channel>>(m, "Channel", R"doc(
 A dynamically-typed compressed image channel with support for lazy-storage.
 
@@ -33,6 +50,15 @@ Supports the following np.dtypes as fill values:
 The data is stored as compressed chunks rather than as one large compressed array allowing
 for decompression/recompression of only parts of the data allowing for very memory-efficient 
 operations.
+
+`get_chunk`, `get_chunks_batch`, `set_chunk` and `get_decompressed` release the GIL while (de-)compressing
+so different channels may be processed in parallel from multiple python threads, e.g. through a 
+`concurrent.futures.ThreadPoolExecutor`. Reading from the same channel from multiple threads is safe, 
+concurrent writes to the same channel (or reads while it is being written to) are however not supported.
+
+A channel retrieved from an `Image` refers to storage owned by that image. Adding or removing channels on the 
+image invalidates it, doing so while another thread is still using the channel is undefined behaviour and may 
+crash the interpreter. Synchronize these calls yourself, e.g. with a `threading.Lock`.
         )doc")
             .def(py::init<py::array,
                 size_t,
@@ -61,6 +87,29 @@ Typically you do not need to modify any of the defaults for `compression_codec`,
 :param compression_codec: Compression codec to use (default: lz4).
 :param compression_level: Compression level (default: 9).
 :param block_size: Block size for compression (default: 32_768).
+:param chunk_size: Chunk size for compression (default: 4_194_304).
+            )doc")
+            // Only accepts np.dtype instances, types (e.g. np.uint8) and strings (e.g. 'uint8') so that any other 
+            // first argument still resolves against the array constructor above.
+            .def(py::init(&compressed_py::dynamic_channel::zeros_from_dtype),
+                py::arg("dtype"),
+                py::arg("width"),
+                py::arg("height"),
+                py::arg("compression_codec") = compressed::enums::codec::lz4,
+                py::arg("compression_level") = 9,
+                py::arg("block_size") = compressed::s_default_blocksize,
+                py::arg("chunk_size") = compressed::s_default_chunksize,
+                R"doc(
+Initialize a zero-initialized lazy-channel of the given dtype without any seed data, this is equivalent to 
+`Channel.zeros`. Prefer this over passing a `np.zeros` array if the channel contents will be overwritten anyways
+as no full-size buffer has to be allocated or compressed.
+
+:param dtype: numpy dtype for the data.
+:param width: Width of the channel.
+:param height: Height of the channel.
+:param compression_codec: Compression codec to use (default: lz4).
+:param compression_level: Compression level (default: 9).
+:param block_size: Block size for compression (default: 32_768).
 :param chunk_size: Chunk size for compression (default: 4_194_304).
             )doc")
             .def_static("full", &compressed_py::dynamic_channel::full,
@@ -204,25 +253,56 @@ start_y = chunk_index * channel.chunk_size() // channel.width()
 
 from there you can compute the full extents of the chunk.
 
-This overload allows you to reuse a buffer rather than having to keep setting up a new one, to use it you should so 
-something along the lines of the below code example. A channels chunks are guaranteed to be the same size for all chunks
-except the last one, so we can reuse the same buffer again.
+This overload allows you to reuse a buffer rather than having to keep setting up a new one and is the preferred
+way of iterating a channel. The data is decompressed directly into the passed array so no intermediate copies take
+place. A channels chunks are guaranteed to be the same size for all chunks except the last one, so we can reuse 
+the same buffer for all of them by slicing it.
 
 .. code-block:: python
 
-    buffer = np.ndarray((channel.chunk_elems(),), dtype= channel.dtype)
-    for i in range(channel.num_chunks() - 1):
-        channel.get_chunk(i, buffer)
+    buffer = np.empty((channel.chunk_elems(),), dtype=channel.dtype)
+    for i in range(channel.num_chunks()):
+        chunk = buffer[:channel.chunk_elems(i)]
+        channel.get_chunk(i, chunk)
         # Modify chunk
-        channel.set_chunk(i, buffer)
+        channel.set_chunk(i, chunk)
 
-    final_buffer = channel.get_chunk(channel.num_chunks() -1)
-    # Modify chunk
-    channel.set_chunk(channel.num_chunks() -1, final_buffer)
+:param chunk_index: Index of the chunk to decompress.
+:param array: The 1D, writeable and C-contiguous numpy array to extract the data to, must be exactly 
+              `chunk_elems(chunk_index)` in size.
+            )doc")
+                    .def("get_chunks_batch", &compressed_py::dynamic_channel::get_chunks_batch,
+                        py::arg("chunk_indices"),
+                        R"doc(
+Get the decompressed data for multiple chunks at once. Unlike calling `get_chunk` in a loop this only releases
+and reacquires the GIL once for the whole batch.
+
+.. code-block:: python
+
+    chunks = channel.get_chunks_batch(range(channel.num_chunks()))
+
+:param chunk_indices: Indices of the chunks to decompress.
+:return: A list of 1D numpy arrays containing the decompressed data, in the same order as `chunk_indices`.
+            )doc")
+                    .def("get_chunk_view", &compressed_py::dynamic_channel::get_chunk_view,
+                        py::arg("chunk_index"),
+                        R"doc(
+Get the decompressed data for a chunk as a read-only memoryview over an internal, thread-local scratch buffer. 
+The scratch buffers are reused across calls so, unlike `get_chunk`, this amortizes to no allocations.
+
+The view keeps its scratch buffer alive and reserved for as long as the view (or any array created from it) is 
+alive, its contents are never overwritten by later calls. Holding on to many views therefore holds on to as many
+buffers, drop or copy them if you need to keep the data around. To modify a chunk, copy it and write it back 
+using `set_chunk`.
+
+.. code-block:: python
+
+    for i in range(channel.num_chunks()):
+        chunk = np.asarray(channel.get_chunk_view(i))
+        # Read from chunk
 
 :param chunk_index: Index of the chunk to decompress.
-:param array: The 1D numpy array to extract the data to, must be exactly `chunk_elems(chunk_index)` in size.
-:return: 1D numpy array containing decompressed data.
+:return: 1D memoryview over the decompressed data.
             )doc")
                     .def("set_chunk", &compressed_py::dynamic_channel::set_chunk,
                         py::arg("chunk_index"), py::arg("array"),
@@ -231,6 +311,52 @@ Replace a chunk's contents with a new array. This array must match the size `cha
 
 :param chunk_index: Index of the chunk to update. Must be less than self.num_chunks
 :param array: 1D numpy array to set onto the chunk.
+            )doc")
+                    .def("chunk_writer", &compressed_py::dynamic_channel::chunk_writer,
+                        R"doc(
+Create a `compressed_image.ChunkWriter` bound to this channel. The writer caches the dtype and 
+chunk layout of the channel making it cheaper than `set_chunk` when writing many chunks.
+
+.. code-block:: python
+
+    writer = channel.chunk_writer()
+    buffer = np.empty((channel.chunk_elems(),), dtype=channel.dtype)
+    for i in range(channel.num_chunks()):
+        chunk = buffer[:channel.chunk_elems(i)]
+        channel.get_chunk(i, chunk)
+        # Modify chunk
+        writer(i, chunk)
+
+:return: A new `compressed_image.ChunkWriter`.
+            )doc")
+                    .def("fill", &compressed_py::dynamic_channel::fill,
+                        py::arg("fill_value"),
+                        R"doc(
+Fill the whole channel with `fill_value`. This discards all of the current data and turns the channel into a
+lazy-channel storing only a single value per-chunk, no compression takes place so this is much faster than
+setting each chunk individually.
+
+:param fill_value: The fill value for the data, may be a float or an integer
+            )doc")
+                    .def("map_chunks", &compressed_py::dynamic_channel::map_chunks,
+                        py::arg("func"),
+                        R"doc(
+Apply `func` to every chunk of the channel. The chunks are decompressed into an internal scratch buffer
+that is reused for all chunks and passed to `func` as a 1D numpy array which should be modified in-place.
+After `func` returns the chunk is compressed and written back into the channel.
+
+The array passed to `func` views into the internal scratch buffer without copying. It is safe to hold on to it
+past the call, in which case a new scratch buffer is allocated for the following chunks. Modifying the array after
+`func` returned has no effect on the channel.
+
+.. code-block:: python
+
+    def invert(chunk: np.ndarray):
+        np.subtract(255, chunk, out=chunk)
+
+    channel.map_chunks(invert)
+
+:param func: A callable taking a single 1D numpy array, its return value is ignored.
             )doc")
                     .def("get_decompressed", &compressed_py::dynamic_channel::get_decompressed,
                         R"doc(
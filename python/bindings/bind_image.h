@@ -30,6 +30,10 @@ Supports the following np.dtypes as fill values:
     - np.int32
 
 The channels are stored as compressed buffers allowing for efficient traversal and decompression.
+
+Images are not thread-safe. Several methods release the GIL while (de-)compressing, so mutating an image 
+(`add_channel`, `add_channels`, `remove_channel`, ...) while another thread accesses it or any of its channels is 
+undefined behaviour and may crash the interpreter. Synchronize these calls yourself, e.g. with a `threading.Lock`.
         )doc")
             .def(py::init<
                     const py::object&,
@@ -261,6 +265,41 @@ with the image metadata.
                    These defaults are tuned for good performance on a wide range of systems.
             )doc")
 
+            .def_static("read_mmap", &compressed_py::dynamic_image::read_mmap,
+                py::arg("dtype"),
+                py::arg("filepath"), 
+                py::arg("subimage") = 0,
+                py::arg("compression_codec") = compressed::enums::codec::lz4,
+                py::arg("compression_level") = 9,
+                py::arg("block_size") = compressed::s_default_blocksize,
+                py::arg("chunk_size") = compressed::s_default_chunksize,
+                R"doc(
+Reads the specified image from disk through a memory-mapping of the file, converting into the passed 
+dtype and compressing on the fly.
+
+This behaves identically to `Image.read` but rather than reading the file through regular file I/O 
+the file is memory-mapped and decoded directly from the mapping. The OS pages the file in on demand 
+and is free to evict these pages again under memory pressure so the file is never held in memory 
+as a whole. This is mostly beneficial for very large files, for small files the difference to 
+`Image.read` is negligible. 
+
+Note that access is now bounded by page-fault latency rather than by sequential reads so for files 
+on e.g. network drives `Image.read` may be the better choice.
+
+If the file format does not support reading from memory this transparently falls back to `Image.read`.
+
+:param dtype: The data type to read as, this doesn't have to correspond to the data type of the
+              image as we will convert to the data on read. If you wish to find out the data type
+              of an image without having to read it you can use the Image.dtype_from_file method.
+:param filepath: The path to the image file, this must be in a format supported by OpenImageIO.
+:param subimage: The subimage within the image to read. Only relevant for a couple of formats such
+                 as tiff or exr.
+:param compression_codec: Compression codec, defaults to lz4.
+:param compression_level: Compression level, defaults to 9.
+:param block_size: The block size used internally, defaults to 32KB. See `Image.read` for details.
+:param chunk_size: The chunk size used internally, defaults to `4 * 1024 * 1024`. See `Image.read` for details.
+            )doc")
+
             .def_static("dtype_from_file", &compressed_py::dynamic_image::dtype_from_file,
                 py::arg("filepath"),
                 R"doc(
@@ -327,6 +366,55 @@ Add a channel to the image from the given uncompressed data. Compresses it and s
                    These defaults are tuned for good performance on a wide range of systems.
             )doc")
 
+            .def("add_channels", &compressed_py::dynamic_image::add_channels,
+                py::arg("data"),
+                py::arg("width"),
+                py::arg("height"),
+                py::arg("names") = std::vector<std::string>{},
+                py::arg("compression_codec") = compressed::enums::codec::lz4,
+                py::arg("compression_level") = 9,
+                py::arg("block_size") = compressed::s_default_blocksize,
+                py::arg("chunk_size") = compressed::s_default_chunksize,
+                R"doc(
+Add multiple channels to the image from the given uncompressed data. This is equivalent to calling `add_channel`
+for every array but compresses all of the channels up-front with the GIL released. The GIL is reacquired before
+the channels are inserted, which only happens once all of them were compressed successfully.
+
+.. code-block:: python
+
+    image.add_channels([r, g, b], image.width, image.height, ["R", "G", "B"])
+
+:param data: The image data to add as channels, each of these needs to both have the same dtype as `self.dtype`
+             as well as having to have the shape of `(height, width)`.
+:param width: The width of the channels, must be the same as the rest of the image.
+:param height: The height of the channels, must be the same as the rest of the image.
+:param names: (Optional) The names of the channels, if specified these must match the number of channels.
+:param compression_codec: Compression codec, defaults to lz4.
+:param compression_level: Compression level, defaults to 9.
+:param block_size: The block size used internally, defaults to 32KB. See `add_channel` for details.
+:param chunk_size: The chunk size used internally, defaults to `4 * 1024 * 1024`. See `add_channel` for details.
+            )doc")
+
+            .def("add_channel_full", &compressed_py::dynamic_image::add_channel_full,
+                py::arg("fill_value"),
+                py::arg("name") = std::nullopt,
+                py::arg("compression_codec") = compressed::enums::codec::lz4,
+                py::arg("compression_level") = 9,
+                py::arg("block_size") = compressed::s_default_blocksize,
+                py::arg("chunk_size") = compressed::s_default_chunksize,
+                R"doc(
+Add a lazy-channel filled with `fill_value` to the image. The channel takes on the width and height of
+the image and only stores a single value per-chunk so unlike `add_channel` no uncompressed data has to be
+allocated or compressed. This is the preferred way of adding a constant channel, e.g. an alpha channel.
+
+:param fill_value: The fill value for the channel, may be a float or an integer.
+:param name: (Optional) The name of the channel.
+:param compression_codec: Compression codec, defaults to lz4.
+:param compression_level: Compression level, defaults to 9.
+:param block_size: The block size used internally, defaults to 32KB. See `add_channel` for details.
+:param chunk_size: The chunk size used internally, defaults to `4 * 1024 * 1024`. See `add_channel` for details.
+            )doc")
+
             .def("remove_channel", &compressed_py::dynamic_image::remove_channel,
                 py::arg("name_or_index"),
                 R"doc(
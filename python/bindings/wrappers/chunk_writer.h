@@ -0,0 +1,88 @@
+#pragma once
+
+#include <span>
+#include <format>
+#include <variant>
+#include <stdexcept>
+
+#include "util/npy_half.h"
+#include "util/variant_t.h"
+#include "compressed/channel.h"
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+namespace py = pybind11;
+
+namespace compressed_py
+{
+
+	/// Writer bound to a single channel, caching the channel's dtype and chunk layout on construction so that
+	/// writing a chunk only has to compare against these rather than re-querying the channel on every call.
+	struct chunk_writer
+	{
+		explicit chunk_writer(variant_t<compressed::channel> channel)
+			: m_Channel(std::move(channel))
+		{
+			std::visit([&](auto&& ch_ptr)
+				{
+					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
+					m_DType = py::dtype::of<T>();
+					m_NumChunks = ch_ptr->num_chunks();
+					m_ChunkElems = ch_ptr->chunk_elems();
+					m_LastChunkElems = m_NumChunks > 0 ? ch_ptr->chunk_elems(m_NumChunks - 1) : 0;
+				}, m_Channel);
+		}
+
+		/// Compress the array into the chunk at `chunk_idx`.
+		void operator()(size_t chunk_idx, const py::array& array)
+		{
+			if (chunk_idx >= m_NumChunks)
+			{
+				throw std::out_of_range(
+					std::format("Chunk index {} is out of range for a channel with {} chunks", chunk_idx, m_NumChunks)
+				);
+			}
+			// Compare by value rather than identity, equivalent dtypes need not be the same object (e.g. after 
+			// unpickling or when carrying metadata).
+			if (!array.dtype().equal(m_DType))
+			{
+				throw std::invalid_argument("Array must have dtype matching channel element type.");
+			}
+			if (array.ndim() != 1)
+			{
+				throw std::invalid_argument("Array must be 1-dimensional.");
+			}
+			if (!(array.flags() & py::array::c_style))
+			{
+				throw std::invalid_argument("Array must be C-contiguous.");
+			}
+
+			const size_t expected_elems = chunk_idx == m_NumChunks - 1 ? m_LastChunkElems : m_ChunkElems;
+			if (static_cast<size_t>(array.shape(0)) != expected_elems)
+			{
+				throw std::invalid_argument("Array length does not match number of chunk elements.");
+			}
+
+			std::visit([&](auto&& ch_ptr)
+				{
+					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
+
+					// set_chunk only reads from the buffer so it is safe to also pass read-only arrays.
+					auto ptr = static_cast<T*>(const_cast<void*>(array.data()));
+
+					py::gil_scoped_release release;
+					ch_ptr->set_chunk(std::span<T>(ptr, expected_elems), chunk_idx);
+				}, m_Channel);
+		}
+
+	private:
+		variant_t<compressed::channel> m_Channel;
+
+		py::dtype m_DType;
+		size_t m_NumChunks = 0;
+		size_t m_ChunkElems = 0;
+		size_t m_LastChunkElems = 0;
+	};
+
+} // compressed_py
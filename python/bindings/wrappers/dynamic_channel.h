@@ -2,9 +2,12 @@
 
 #include <vector>
 #include <variant>
+#include <algorithm>
+#include <memory>
 
 #include "util/npy_half.h"
 #include "util/variant_t.h"
+#include "wrappers/chunk_writer.h"
 #include "compressed/channel.h"
 #include "compressed/util.h"
 
@@ -139,6 +142,24 @@ namespace compressed_py
 				});
 		}
 
+		/// The dtype-like objects accepted by the dtype constructor overload. This is deliberately narrower than a 
+		/// py::object as otherwise the overload would capture any other first argument (e.g. nested lists).
+		using dtype_like = std::variant<py::dtype, py::type, py::str>;
+
+		/// Same as `zeros` but only accepting dtype-like objects, used for the dtype constructor overload.
+		static std::shared_ptr<dynamic_channel> zeros_from_dtype(
+			const dtype_like& dtype_,
+			size_t width,
+			size_t height,
+			compressed::enums::codec compression_codec = compressed::enums::codec::lz4,
+			uint8_t compression_level = 9,
+			size_t block_size = compressed::s_default_blocksize,
+			size_t chunk_size = compressed::s_default_chunksize)
+		{
+			auto dtype = std::visit([](const auto& value) { return py::object(value); }, dtype_);
+			return zeros(dtype, width, height, compression_codec, compression_level, block_size, chunk_size);
+		}
+
 		static std::shared_ptr<dynamic_channel> zeros_like(const std::shared_ptr<dynamic_channel>& other)
 		{
 			return std::visit([](auto&& ch_ptr)
@@ -280,10 +301,22 @@ namespace compressed_py
 						throw std::invalid_argument("Array length does not match number of chunk elements.");
 					}
 
-					// Get a mutable span and fill it
+					// We decompress directly into the arrays memory so it must be both writeable and contiguous.
+					if (!array.writeable())
+					{
+						throw std::invalid_argument("Array must be writeable.");
+					}
+					if (!(array.flags() & py::array::c_style))
+					{
+						throw std::invalid_argument("Array must be C-contiguous.");
+					}
+
+					// Get a mutable span and fill it, the pointer must be retrieved before releasing the GIL as we
+					// may not touch any python objects afterwards.
 					auto buf = static_cast<T*>(array.mutable_data());
 					std::span<T> buffer(buf, ch_ptr->chunk_elems(chunk_idx));
 
+					py::gil_scoped_release release;
 					ch_ptr->get_chunk(buffer, chunk_idx);
 
 				}, base_variant_class::m_ClassVariant);
@@ -296,8 +329,11 @@ namespace compressed_py
 			return std::visit([&](auto&& ch_ptr) -> py::array
 				{
 					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
-					compressed::util::default_init_vector<T> buffer(this->chunk_elems(chunk_idx));
-					ch_ptr->get_chunk(std::span<T>(buffer), chunk_idx);
+					compressed::util::default_init_vector<T> buffer(ch_ptr->chunk_elems(chunk_idx));
+					{
+						py::gil_scoped_release release;
+						ch_ptr->get_chunk(std::span<T>(buffer), chunk_idx);
+					}
 
 					// Use the size, ptr overload of array_t. Since array_t is an extension of py::array we can
 					// implicitly cast back down.
@@ -305,6 +341,101 @@ namespace compressed_py
 				}, base_variant_class::m_ClassVariant);
 		}
 
+		/// Decompresses the chunk into a thread-local scratch arena returning a read-only memoryview over it. Every
+		/// view holds a reference to the arena it points into so it stays valid and unchanged for as long as the view
+		/// (or any array created from it) is alive.
+		/// \param chunk_idx Index of the chunk to retrieve.
+		py::memoryview get_chunk_view(size_t chunk_idx) const
+		{
+			using arena_t = compressed::util::default_init_vector<std::byte>;
+
+			// Pool of scratch arenas for this thread, these are shared across all channels and dtypes. An arena is 
+			// only reused once no views into it are left which in a typical loop (where the previous chunk is still 
+			// alive while requesting the next) alternates between two arenas, so repeated calls amortize to zero 
+			// allocations. 
+			thread_local std::vector<std::shared_ptr<arena_t>> arenas;
+
+			// Maximum number of unused arenas we keep around, holding on to many views at once grows the pool but 
+			// once these are dropped we release all but this many arenas again.
+			constexpr size_t max_idle_arenas = 2;
+
+			return std::visit([&](auto&& ch_ptr) -> py::memoryview
+				{
+					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
+
+					size_t num_idle = 0;
+					std::erase_if(arenas, [&](const auto& arena)
+						{
+							return arena.use_count() == 1 && ++num_idle > max_idle_arenas;
+						});
+
+					const size_t num_elems = ch_ptr->chunk_elems(chunk_idx);
+					auto it = std::find_if(arenas.begin(), arenas.end(), [](const auto& arena)
+						{
+							return arena.use_count() == 1;
+						});
+					std::shared_ptr<arena_t> arena = it != arenas.end() ? *it : arenas.emplace_back(std::make_shared<arena_t>());
+					if (arena->size() < num_elems * sizeof(T))
+					{
+						arena->resize(num_elems * sizeof(T));
+					}
+
+					auto ptr = reinterpret_cast<T*>(arena->data());
+					{
+						py::gil_scoped_release release;
+						ch_ptr->get_chunk(std::span<T>(ptr, num_elems), chunk_idx);
+					}
+
+					// The capsule keeps the arena alive for as long as the array (and therefore the view) referencing 
+					// it, even after the thread exits.
+					auto owner = py::capsule(new std::shared_ptr<arena_t>(std::move(arena)), [](void* owned)
+						{
+							delete static_cast<std::shared_ptr<arena_t>*>(owned);
+						});
+					auto array = py::array_t<T>(static_cast<py::ssize_t>(num_elems), ptr, owner);
+					array.attr("flags").attr("writeable") = false;
+					return py::memoryview(array);
+				}, base_variant_class::m_ClassVariant);
+		}
+
+		/// Decompress multiple chunks at once, releasing the GIL only once for the whole batch.
+		/// \param chunk_indices The indices of the chunks to decompress.
+		std::vector<py::array> get_chunks_batch(const std::vector<size_t>& chunk_indices) const
+		{
+			return std::visit([&](auto&& ch_ptr) -> std::vector<py::array>
+				{
+					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
+
+					// Allocate all the output arrays up-front while we still hold the GIL and decompress directly 
+					// into their memory, this way no python objects are touched while the GIL is released.
+					std::vector<py::array> arrays;
+					std::vector<std::span<T>> buffers;
+					arrays.reserve(chunk_indices.size());
+					buffers.reserve(chunk_indices.size());
+					for (auto chunk_idx : chunk_indices)
+					{
+						if (chunk_idx >= ch_ptr->num_chunks())
+						{
+							throw std::out_of_range(
+								std::format("Chunk index {} is out of range for a channel with {} chunks", chunk_idx, ch_ptr->num_chunks())
+							);
+						}
+						auto array = py::array_t<T>(static_cast<py::ssize_t>(ch_ptr->chunk_elems(chunk_idx)));
+						buffers.push_back(std::span<T>(array.mutable_data(), static_cast<size_t>(array.size())));
+						arrays.push_back(std::move(array));
+					}
+
+					{
+						py::gil_scoped_release release;
+						for (size_t i = 0; i < chunk_indices.size(); ++i)
+						{
+							ch_ptr->get_chunk(buffers[i], chunk_indices[i]);
+						}
+					}
+					return arrays;
+				}, base_variant_class::m_ClassVariant);
+		}
+
 		void set_chunk(size_t chunk_idx, py::array array)
 		{
 			std::visit([&](auto&& ch_ptr)
@@ -330,15 +461,112 @@ namespace compressed_py
 
 					std::span<T> buffer(static_cast<T*>(info.ptr), info.size);
 
+					// `info` keeps the buffer alive for the duration of the call so it is safe to release the GIL.
+					py::gil_scoped_release release;
 					ch_ptr->set_chunk(buffer, chunk_idx);
 				}, base_variant_class::m_ClassVariant);
 		}
 
+		/// Create a writer bound to this channel which caches its dtype and chunk layout.
+		compressed_py::chunk_writer chunk_writer() const
+		{
+			return compressed_py::chunk_writer(base_variant_class::m_ClassVariant);
+		}
+
+		/// Fill the whole channel with the given value without any (de-)compression taking place.
+		void fill(py::object fill_value)
+		{
+			std::visit([&](auto&& ch_ptr)
+				{
+					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
+					T value{};
+					try
+					{
+						// Attempt to cast the fill_value to the correct target type
+						value = fill_value.cast<T>();
+					}
+					catch (const py::cast_error&)
+					{
+						throw std::runtime_error("Could not convert fill_value to the target dtype.");
+					}
+
+					ch_ptr->fill(value);
+				}, base_variant_class::m_ClassVariant);
+		}
+
+		/// Apply `func` to every chunk of the channel in-place, `func` receives a 1D numpy array which it is expected
+		/// to modify in-place. The chunk is then recompressed and written back.
+		void map_chunks(const py::function& func)
+		{
+			std::visit([&](auto&& ch_ptr)
+				{
+					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
+					if (ch_ptr->num_chunks() == 0)
+					{
+						return;
+					}
+
+					using buffer_t = compressed::util::default_init_vector<T>;
+
+					// All chunks except for the last are guaranteed to be the same size so we can allocate a single
+					// scratch buffer of the first chunk's size and reuse it for all chunks.
+					auto buffer = std::make_shared<buffer_t>(ch_ptr->chunk_elems(0));
+					for (size_t chunk_idx = 0; chunk_idx < ch_ptr->num_chunks(); ++chunk_idx)
+					{
+						std::span<T> chunk(buffer->data(), ch_ptr->chunk_elems(chunk_idx));
+						ch_ptr->get_chunk(chunk, chunk_idx);
+
+						{
+							// The array views into the scratch buffer without copying, the capsule keeps the buffer 
+							// alive in case `func` holds on to the array past the call.
+							auto owner = py::capsule(new std::shared_ptr<buffer_t>(buffer), [](void* owned)
+								{
+									delete static_cast<std::shared_ptr<buffer_t>*>(owned);
+								});
+							auto view = py::array_t<T>(static_cast<py::ssize_t>(chunk.size()), chunk.data(), owner);
+							func(view);
+						}
+
+						ch_ptr->set_chunk(chunk, chunk_idx);
+
+						// `func` kept a reference to the array, hand the buffer over to it and continue with a new one
+						// so the kept array isn't overwritten by the following chunks.
+						if (buffer.use_count() > 1)
+						{
+							buffer = std::make_shared<buffer_t>(ch_ptr->chunk_elems(0));
+						}
+					}
+				}, base_variant_class::m_ClassVariant);
+		}
+
 		py::array get_decompressed() const
 		{
 			return std::visit([](auto&& ch_ptr) -> py::array
 				{
-					auto decompressed = ch_ptr->get_decompressed();
+					using T = typename std::decay_t<decltype(*ch_ptr)>::value_type;
+
+					// Constant lazy-channels can directly be written into the output array, skipping both the 
+					// decompression and the intermediate std::vector.
+					if (auto value = ch_ptr->lazy_constant())
+					{
+						auto out = py::array_t<T>(std::vector<py::ssize_t>{
+							static_cast<py::ssize_t>(ch_ptr->height()),
+							static_cast<py::ssize_t>(ch_ptr->width())
+						});
+						T* out_ptr = out.mutable_data();
+						const auto out_size = out.size();
+						{
+							py::gil_scoped_release release;
+							std::fill_n(out_ptr, out_size, value.value());
+						}
+						return out;
+					}
+
+					std::vector<T> decompressed;
+					{
+						py::gil_scoped_release release;
+						decompressed = ch_ptr->get_decompressed();
+					}
 
 					// This will handle converting it into a 2d numpy array.
 					return py_img_util::to_py_array(std::move(decompressed), ch_ptr->width(), ch_ptr->height());
@@ -94,6 +94,31 @@ namespace compressed_py
 				});
 		}
 
+		static std::shared_ptr<dynamic_image> read_mmap(
+			const py::object& dtype_,
+			std::string filepath,
+			int subimage,
+			compressed::enums::codec compression_codec = compressed::enums::codec::lz4,
+			size_t compression_level = 9,
+			size_t block_size = compressed::s_default_blocksize,
+			size_t chunk_size = compressed::s_default_chunksize
+		)
+		{
+			// This allows to take e.g. np.uint8 or 'uint8' as dtype rather than only allowing for an instantiated 
+			// numpy.dtype
+			auto dtype = py::dtype::from_args(dtype_);
+			return dispatch_by_dtype(dtype, [&](auto tag) -> std::shared_ptr<dynamic_image>
+				{
+					using T = decltype(tag);
+					static_assert(np_bitdepth<T>, "Unsupported type passed to read_mmap");
+
+					auto image_ptr = std::make_shared<compressed::image<T>>(
+						compressed::image<T>::read_mmap(filepath, subimage, compression_codec, compression_level, block_size, chunk_size)
+					);
+					return std::make_shared<dynamic_image>(std::move(image_ptr));
+				});
+		}
+
 		static std::shared_ptr<dynamic_image> read(
 			const py::object& dtype_,
 			std::string filepath,
@@ -232,6 +257,84 @@ namespace compressed_py
 			);
 		}
 
+		void add_channels(
+			std::vector<py::array> data,
+			size_t width,
+			size_t height,
+			std::vector<std::string> names = {},
+			compressed::enums::codec compression_codec = compressed::enums::codec::lz4,
+			uint8_t compression_level = 9,
+			size_t block_size = compressed::s_default_blocksize,
+			size_t chunk_size = compressed::s_default_chunksize
+		)
+		{
+			std::visit([&](auto&& img_ptr)
+				{
+					using T = typename std::decay_t<decltype(*img_ptr)>::value_type;
+
+					// Keep the typed arrays alive for the duration of the call as the spans only view into them.
+					std::vector<py::array_t<T>> typed_arrays;
+					std::vector<std::span<const T>> spans;
+					typed_arrays.reserve(data.size());
+					spans.reserve(data.size());
+					for (auto& array : data)
+					{
+						if (!py::isinstance<py::array_t<T>>(array))
+						{
+							throw std::invalid_argument("Array must have dtype matching image element type.");
+						}
+						// Validate dimensions
+						if (array.ndim() != 2)
+						{
+							throw std::invalid_argument("Array must be 2-dimensional.");
+						}
+
+						typed_arrays.push_back(array.cast<py::array_t<T>>());
+						spans.push_back(py_img_util::from_py_array(py_img_util::tag::view{}, typed_arrays.back(), width, height));
+					}
+
+					// No python objects are touched while compressing so we release the GIL for that part only. Inserting 
+					// mutates the image which other python threads may be accessing so that happens with the GIL held.
+					std::vector<compressed::channel<T>> channels;
+					{
+						py::gil_scoped_release release;
+						channels = compressed::image<T>::compress_channels(
+							spans, width, height, compression_codec, compression_level, block_size, chunk_size
+						);
+					}
+					img_ptr->add_channels(std::move(channels), names);
+				}, base_variant_class::m_ClassVariant
+			);
+		}
+
+		void add_channel_full(
+			py::object fill_value,
+			std::optional<std::string> name = std::nullopt,
+			compressed::enums::codec compression_codec = compressed::enums::codec::lz4,
+			uint8_t compression_level = 9,
+			size_t block_size = compressed::s_default_blocksize,
+			size_t chunk_size = compressed::s_default_chunksize
+		)
+		{
+			std::visit([&](auto&& img_ptr)
+				{
+					using T = typename std::decay_t<decltype(*img_ptr)>::value_type;
+					T value{};
+					try
+					{
+						// Attempt to cast the fill_value to the correct target type
+						value = fill_value.cast<T>();
+					}
+					catch (const py::cast_error&)
+					{
+						throw std::runtime_error("Could not convert fill_value to the target dtype.");
+					}
+
+					img_ptr->add_channel_full(value, name, compression_codec, compression_level, block_size, chunk_size);
+				}, base_variant_class::m_ClassVariant
+			);
+		}
+
 		void remove_channel(std::variant<size_t, std::string> index_or_name)
 		{
 			std::visit([&](auto&& img_ptr)
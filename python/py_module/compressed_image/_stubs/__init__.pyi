@@ -1 +1 @@
-from ._compressed_image import Codec, Channel, Image
\ No newline at end of file
+from ._compressed_image import Codec, Channel, ChunkWriter, Image
\ No newline at end of file
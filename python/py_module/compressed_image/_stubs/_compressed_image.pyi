@@ -3,7 +3,7 @@ import collections.abc
 import numpy
 import numpy.typing
 import typing
-__all__ = ['Codec', 'Channel', 'Image']
+__all__ = ['Codec', 'Channel', 'ChunkWriter', 'Image']
 
 
 # Pybind11 does not generate enums inheriting from enum.Enum but for all intents and purposes this is an enum when
@@ -51,7 +51,17 @@ class Codec:
 
 
 class Channel:
+    """
+    A dynamically-typed compressed image channel with support for lazy-storage.
 
+    `get_chunk`, `get_chunks_batch`, `set_chunk` and `get_decompressed` release the GIL while (de-)compressing.
+    Reading from the same channel from multiple threads is safe, concurrent writes to the same channel (or reads 
+    while it is being written to) are not supported. A channel retrieved from an `Image` refers to storage owned
+    by that image, adding or removing channels on the image while another thread uses the channel is undefined 
+    behaviour and may crash the interpreter.
+    """
+
+    @typing.overload
     def __init__(
         self, 
         data: numpy.ndarray, 
@@ -64,6 +74,19 @@ class Channel:
         ) -> None:
         ...
 
+    @typing.overload
+    def __init__(
+        self, 
+        dtype: typing.Union[numpy.dtype, type, str], 
+        width: typing.SupportsInt, 
+        height: typing.SupportsInt, 
+        compression_codec: Codec = Codec.lz4, 
+        compression_level: typing.SupportsInt = 9, 
+        block_size: typing.SupportsInt = 32_768, 
+        chunk_size: typing.SupportsInt = 4_194_304
+        ) -> None:
+        ...
+
     @staticmethod
     def full(
         dtype: numpy.typing.DTypeLike, 
@@ -141,17 +164,36 @@ class Channel:
     def compression_level(self) -> int:
         ...
 
+    def chunk_writer(self) -> ChunkWriter:
+        ...
+
+    def fill(self, fill_value: typing.SupportsFloat | typing.SupportsInt) -> None:
+        ...
+
     @typing.overload
     def get_chunk(self, chunk_index: typing.SupportsInt) -> numpy.ndarray:
         ...
 
     @typing.overload
-    def get_chunk(self, chunk_index: typing.SupportsInt, array: numpy.ndarray) -> numpy.ndarray:
+    def get_chunk(self, chunk_index: typing.SupportsInt, array: numpy.ndarray) -> None:
+        ...
+
+    def get_chunks_batch(self, chunk_indices: collections.abc.Sequence[typing.SupportsInt]) -> list[numpy.ndarray]:
+        ...
+
+    def get_chunk_view(self, chunk_index: typing.SupportsInt) -> memoryview:
+        """
+        Read-only view over a thread-local scratch buffer holding the decompressed chunk. The buffer stays valid
+        and unchanged for as long as the view (or any array created from it) is alive.
+        """
         ...
 
     def get_decompressed(self) -> numpy.ndarray:
         ...
 
+    def map_chunks(self, func: collections.abc.Callable[[numpy.ndarray], typing.Any]) -> None:
+        ...
+
     def num_chunks(self) -> int:
         ...
 
@@ -165,7 +207,20 @@ class Channel:
         ...
 
 
+class ChunkWriter:
+
+    def __call__(self, chunk_index: typing.SupportsInt, array: numpy.ndarray) -> None:
+        ...
+
+
 class Image:
+    """
+    A dynamically-typed compressed image composed of multiple channels.
+
+    Images are not thread-safe. Several methods release the GIL while (de-)compressing, so mutating an image 
+    (`add_channel`, `add_channels`, `remove_channel`, ...) while another thread accesses it or any of its channels 
+    is undefined behaviour and may crash the interpreter.
+    """
 
     def __init__(
         self, 
@@ -222,6 +277,18 @@ class Image:
         ) -> Image:
         ...
 
+    @staticmethod
+    def read_mmap(
+        dtype: numpy.typing.DTypeLike, 
+        filepath: str, 
+        subimage: typing.SupportsInt = 0, 
+        compression_codec: Codec = Codec.lz4, 
+        compression_level: typing.SupportsInt = 9, 
+        block_size: typing.SupportsInt = 32_768, 
+        chunk_size: typing.SupportsInt = 4_194_304
+        ) -> Image:
+        ...
+
     @staticmethod
     def dtype_from_file(filepath: str) -> numpy.dtype:
         ...
@@ -239,6 +306,30 @@ class Image:
         ) -> None:
         ...
 
+    def add_channels(
+        self, 
+        data: collections.abc.Sequence[numpy.ndarray], 
+        width: typing.SupportsInt, 
+        height: typing.SupportsInt, 
+        names: collections.abc.Sequence[str] = [], 
+        compression_codec: Codec = Codec.lz4, 
+        compression_level: typing.SupportsInt = 9,
+        block_size: typing.SupportsInt = 32_768, 
+        chunk_size: typing.SupportsInt = 4_194_304
+        ) -> None:
+        ...
+
+    def add_channel_full(
+        self, 
+        fill_value: typing.SupportsFloat | typing.SupportsInt, 
+        name: typing.Optional[str] = None, 
+        compression_codec: Codec = Codec.lz4, 
+        compression_level: typing.SupportsInt = 9,
+        block_size: typing.SupportsInt = 32_768, 
+        chunk_size: typing.SupportsInt = 4_194_304
+        ) -> None:
+        ...
+
     def remove_channel(self, name_or_index: typing.Union[str, int]) -> None:
         ...
 
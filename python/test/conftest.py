@@ -0,0 +1,116 @@
+import functools
+import pathlib
+from typing import Callable, Optional, Sequence
+
+import pytest
+
+import numpy as np
+import numpy.typing as npt
+
+import compressed_image as compressed
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="run tests marked as slow")
+
+
+# This must run before pytest-xdist's own collection hook which derives the `@<group>` nodeid suffix used by 
+# `--dist loadgroup` from the xdist_group marks, marks added after that are silently ignored.
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    # Skip the slow tests unless explicitly requested, these are run as part of the CI.
+    if not config.getoption("--runslow"):
+        skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
+
+    # Group all tests sharing the same (dtype, width, height) parameters onto the same pytest-xdist worker
+    # so that class-scoped fixtures are only constructed once per parameter tuple rather than once per
+    # worker the tests happen to get distributed to.
+    # Tests only parametrized over the dtype (i.e. the image tests) are grouped per-dtype instead, this way 
+    # all cached reads of a dtype go through the same worker's `read_image_cached` and each file is only decoded 
+    # once per dtype (tests which modify the image still read it themselves) while the different dtypes still run 
+    # in parallel. Parametrizations carrying a shape, such as `test_add_channel`, fall into the (dtype, shape) 
+    # groups above as they don't read any files.
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None:
+            continue
+
+        params = callspec.params
+        if "dtype" not in params:
+            continue
+
+        dtype_name = np.dtype(params["dtype"]).name
+        if "width" in params and "height" in params:
+            item.add_marker(pytest.mark.xdist_group(name=f"{dtype_name}-{params['width']}x{params['height']}"))
+        else:
+            item.add_marker(pytest.mark.xdist_group(name=dtype_name))
+
+
+@pytest.fixture(scope="class")
+def compressed_channel(width: int, height: int, dtype: npt.DTypeLike) -> compressed.Channel:
+    """
+    A compressed channel of the given shape and dtype, this is only constructed once per parameter tuple so
+    tests using it must not modify it.
+    """
+    arr = np.zeros((height, width), dtype)
+    return compressed.Channel(
+        arr,
+        width,
+        height,
+    )
+
+
+@pytest.fixture(scope="session")
+def images_dir() -> pathlib.Path:
+    """
+    The base dir to the cpp test images, so we don't have to copy them over to our python test suite.
+    """
+    return pathlib.Path(__file__).resolve().parents[2] / "test" / "images"
+
+
+@pytest.fixture(scope="session")
+def read_image_cached(images_dir: pathlib.Path) -> Callable[..., compressed.Image]:
+    """
+    Returns a function `read(dtype, name, subimage = 0, channel_indices = None, channel_names = None)` reading the
+    file `name` relative to the test images dir, which memoizes the read images across tests. Only use this for 
+    reads that are repeated across tests, every cached image stays in memory until it is evicted. As the images are 
+    shared across tests they must not be modified, tests modifying the image should call `compressed.Image.read` 
+    directly.
+    """
+    # The tests of a dtype run together on a single worker (see `pytest_collection_modifyitems`) so we only need 
+    # to hold on to the images of a couple of dtypes at a time.
+    @functools.lru_cache(maxsize=2)
+    def _read(
+            dtype: np.dtype, 
+            name: str, 
+            subimage: int, 
+            channel_indices: Optional[tuple[int, ...]], 
+            channel_names: Optional[tuple[str, ...]]
+        ) -> compressed.Image:
+        kwargs = {}
+        if channel_indices is not None:
+            kwargs["channel_indices"] = list(channel_indices)
+        if channel_names is not None:
+            kwargs["channel_names"] = list(channel_names)
+        return compressed.Image.read(dtype, str(images_dir / name), subimage = subimage, **kwargs)
+
+    def read(
+            dtype: npt.DTypeLike, 
+            name: str, 
+            subimage: int = 0, 
+            channel_indices: Optional[Sequence[int]] = None, 
+            channel_names: Optional[Sequence[str]] = None
+        ) -> compressed.Image:
+        # Normalize the arguments so that e.g. np.float16 and 'float16' or lists and tuples hit the same entry.
+        return _read(
+            np.dtype(dtype), 
+            name, 
+            subimage, 
+            None if channel_indices is None else tuple(channel_indices), 
+            None if channel_names is None else tuple(channel_names),
+        )
+
+    return read
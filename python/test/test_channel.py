@@ -1,3 +1,6 @@
+import functools
+from typing import Callable
+
 import pytest
 
 import numpy as np
@@ -5,17 +8,53 @@ import numpy.typing as npt
 
 import compressed_image as compressed
 
+
+@functools.lru_cache(maxsize=None)
+def _itemsize(dtype: npt.DTypeLike) -> int:
+    return np.dtype(dtype).itemsize
+
+
+def _scanline_channel(dtype: npt.DTypeLike, width: int, height: int) -> compressed.Channel:
+    """
+    A zero-initialized lazy-channel with exactly one scanline per chunk, no dense buffer is allocated for it.
+    """
+    return compressed.Channel(dtype, width, height, chunk_size = width * _itemsize(dtype))
+
+
+def _write_indexed_chunks(channel: compressed.Channel, write: Callable[[int, np.ndarray], None]):
+    """
+    Write `i % 100` into every chunk `i` of the channel through `write(i, chunk)`, reusing a single buffer.
+    """
+    buffer = np.empty((channel.chunk_elems(),), channel.dtype)
+    for i in range(channel.num_chunks()):
+        chunk = buffer[:channel.chunk_elems(i)]
+        chunk[:] = i % 100
+        write(i, chunk)
+
+
 class TestCompressedChannel:
     
     def test_invalid_dtype(self):
         with pytest.raises(ValueError):
-            compressed.Channel.zeros(np.bool, 1, 1)
+            compressed.Channel.zeros(np.bool_, 1, 1)
         with pytest.raises(ValueError):
-            compressed.Channel.full(np.bool, 100, 1, 1)
+            compressed.Channel.full(np.bool_, 100, 1, 1)
         with pytest.raises(ValueError):
-            array = np.array((1, 1), np.bool)
+            array = np.array((1, 1), np.bool_)
             compressed.Channel(array, 1, 1)
 
+    def test_init_from_dtype_like(self):
+        for dtype in (np.uint16, np.dtype(np.uint16), "uint16"):
+            channel = compressed.Channel(dtype, 32, 16)
+            assert channel.dtype == np.uint16
+            assert channel.shape == (16, 32)
+
+    def test_init_from_nested_list(self):
+        # Non-dtype arguments must not be picked up by the dtype constructor overload but keep resolving against
+        # the array constructor (which only takes np.ndarray).
+        with pytest.raises(TypeError, match="incompatible constructor arguments"):
+            compressed.Channel([[1, 2], [3, 4]], 2, 2)
+
 # Parametrize over all supported dtypes by compressed.Channel as well as a
 # variety of shapes to ensure we cover edge cases.
 @pytest.mark.parametrize("width, height", [
@@ -23,8 +62,8 @@ class TestCompressedChannel:
     (123, 456),
     (2048, 16),
     (1920, 1080),
-    (4096, 4096),
-])
+    pytest.param(4096, 4096, marks=pytest.mark.slow),
+], scope="class")
 @pytest.mark.parametrize("dtype", 
     [
         np.uint8, 
@@ -35,12 +74,14 @@ class TestCompressedChannel:
         np.int32,
         np.float16,
         np.float32
-    ]
+    ],
+    scope="class",
+    ids=lambda dtype: np.dtype(dtype).name
 )
 class TestCompressedChannelParametrized:
 
     def test_initialization(self, width: int, height: int, dtype: npt.DTypeLike):
-        arr = np.ndarray((height, width), dtype)
+        arr = np.empty((height, width), dtype)
         channel = compressed.Channel(
             arr,
             width,
@@ -48,18 +89,18 @@ class TestCompressedChannelParametrized:
         )
 
     def test_initialization_with_small_chunksize(self, width: int, height: int, dtype: npt.DTypeLike):
-        arr = np.ndarray((height, width), dtype)
+        arr = np.empty((height, width), dtype)
         channel = compressed.Channel(
             arr,
             width,
             height,
-            chunk_size = width * np.dtype(dtype).itemsize,
+            chunk_size = width * _itemsize(dtype),
             compression_codec = compressed.Codec.blosclz,
             compression_level = 2,
         )
 
         assert channel.num_chunks() == height
-        assert channel.chunk_size() == width * np.dtype(dtype).itemsize
+        assert channel.chunk_size() == width * _itemsize(dtype)
         assert channel.height == height
         assert channel.width == width
         assert channel.shape == (height, width)
@@ -91,7 +132,8 @@ class TestCompressedChannelParametrized:
         # Even though we compare floating point values, as we set these values
         # directly these should still be identical, no need to check for 
         # np.allclose
-        assert np.array_equal(decompressed, np.full((height, width), 25, dtype))
+        assert decompressed.dtype == dtype
+        assert (decompressed == dtype(25)).all()
 
     def test_zeros(self, width: int, height: int, dtype: npt.DTypeLike):
         channel = compressed.Channel.zeros(
@@ -115,15 +157,11 @@ class TestCompressedChannelParametrized:
         # Even though we compare floating point values, as we set these values
         # directly these should still be identical, no need to check for 
         # np.allclose
-        assert np.array_equal(decompressed, np.full((height, width), 0, dtype))
+        assert decompressed.dtype == dtype
+        assert (decompressed == dtype(0)).all()
 
-    def test_full_like(self, width: int, height: int, dtype: npt.DTypeLike):
-        arr = np.ndarray((height, width), dtype)
-        channel_compare = compressed.Channel(
-            arr,
-            width,
-            height,
-        )
+    def test_full_like(self, width: int, height: int, dtype: npt.DTypeLike, compressed_channel: compressed.Channel):
+        channel_compare = compressed_channel
 
         channel = compressed.Channel.full_like(
             channel_compare,
@@ -143,15 +181,11 @@ class TestCompressedChannelParametrized:
         # Even though we compare floating point values, as we set these values
         # directly these should still be identical, no need to check for 
         # np.allclose
-        assert np.array_equal(decompressed, np.full((height, width), 25, dtype))
+        assert decompressed.dtype == dtype
+        assert (decompressed == dtype(25)).all()
 
-    def test_zeros_like(self, width: int, height: int, dtype: npt.DTypeLike):
-        arr = np.ndarray((height, width), dtype)
-        channel_compare = compressed.Channel(
-            arr,
-            width,
-            height,
-        )
+    def test_zeros_like(self, width: int, height: int, dtype: npt.DTypeLike, compressed_channel: compressed.Channel):
+        channel_compare = compressed_channel
 
         channel = compressed.Channel.zeros_like(channel_compare)
 
@@ -168,37 +202,29 @@ class TestCompressedChannelParametrized:
         # Even though we compare floating point values, as we set these values
         # directly these should still be identical, no need to check for 
         # np.allclose
-        assert np.array_equal(decompressed, np.full((height, width), 0, dtype))
+        assert decompressed.dtype == dtype
+        assert (decompressed == dtype(0)).all()
 
     def test_modify_chunk(self, width: int, height: int, dtype: npt.DTypeLike):
-        arr = np.zeros((height, width), dtype)
-        channel = compressed.Channel(
-            arr,
-            width,
-            height,
-            chunk_size = width * np.dtype(dtype).itemsize,
-        )
+        channel = _scanline_channel(dtype, width, height)
 
         chunk_0 = channel.get_chunk(0)
-        assert channel.chunk_size() == width * np.dtype(dtype).itemsize
+        assert channel.chunk_size() == width * _itemsize(dtype)
         assert chunk_0.dtype == dtype
         assert chunk_0.shape == (width,)
-        assert np.array_equal(chunk_0, np.zeros_like(chunk_0, dtype))
+        assert (chunk_0 == dtype(0)).all()
 
-        channel.set_chunk(0, np.full_like(chunk_0, 100, dtype))
+        chunk_0[:] = 100
+        channel.set_chunk(0, chunk_0)
 
-        assert np.array_equal(channel.get_chunk(0), np.full_like(chunk_0, 100, dtype))
+        chunk_0 = channel.get_chunk(0)
+        assert chunk_0.dtype == dtype
+        assert (chunk_0 == dtype(100)).all()
 
     def test_set_invalid_chunk_size(self, width: int, height: int, dtype: npt.DTypeLike):
         # Test that we can correctly handle invalid arguments being passed to the set_chunk
         # function
-        arr = np.zeros((height, width), dtype)
-        channel = compressed.Channel(
-            arr,
-            width,
-            height,
-            chunk_size = width * np.dtype(dtype).itemsize,
-        )
+        channel = _scanline_channel(dtype, width, height)
 
         # Invalid shape dimensions but correct number of elements
         with pytest.raises(ValueError):
@@ -220,7 +246,7 @@ class TestCompressedChannelParametrized:
             height,
         )
         
-        buffer = np.ndarray((channel.chunk_elems(),), dtype= channel.dtype)
+        buffer = np.empty((channel.chunk_elems(),), dtype= channel.dtype)
         for i in range(channel.num_chunks() - 1):
             channel.get_chunk(i, buffer)
             buffer[:] = i
@@ -235,4 +261,145 @@ class TestCompressedChannelParametrized:
         for i in range(channel.num_chunks()):
             chunk = channel.get_chunk(i)
 
-            assert np.all(chunk == i)
\ No newline at end of file
+            assert (chunk == dtype(i)).all()
+
+    def test_fill(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+
+        channel.fill(25)
+
+        assert channel.shape == (height, width)
+        assert channel.num_chunks() == height
+        assert channel.chunk_size() == width * _itemsize(dtype)
+
+        decompressed = channel.get_decompressed()
+        assert decompressed.shape == channel.shape
+        assert decompressed.dtype == dtype
+        assert (decompressed == dtype(25)).all()
+
+    def test_map_chunks(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+
+        def add_one(chunk: np.ndarray):
+            assert chunk.dtype == dtype
+            assert chunk.shape == (width,)
+            chunk += 1
+
+        channel.map_chunks(add_one)
+
+        decompressed = channel.get_decompressed()
+        assert decompressed.shape == channel.shape
+        assert decompressed.dtype == dtype
+        assert (decompressed == dtype(1)).all()
+
+    def test_map_chunks_keep_chunk(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+        _write_indexed_chunks(channel, channel.set_chunk)
+
+        kept = []
+
+        def keep(chunk: np.ndarray):
+            kept.append(chunk)
+
+        channel.map_chunks(keep)
+
+        # Chunks held on to past the call must stay valid and must not be overwritten by the following chunks.
+        assert len(kept) == channel.num_chunks()
+        for i, chunk in enumerate(kept):
+            assert (chunk == dtype(i % 100)).all()
+
+    def test_get_chunk_invalid_buffer(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+
+        # Non-contiguous buffer with the correct number of elements
+        buffer = np.zeros((width * 2,), dtype)
+        with pytest.raises(ValueError):
+            channel.get_chunk(0, buffer[::2])
+
+        # Read-only buffer
+        buffer = np.zeros((width,), dtype)
+        buffer.flags.writeable = False
+        with pytest.raises(ValueError):
+            channel.get_chunk(0, buffer)
+
+    def test_get_chunk_view(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+        _write_indexed_chunks(channel, channel.set_chunk)
+
+        views = []
+        for i in range(channel.num_chunks()):
+            view = channel.get_chunk_view(i)
+            assert view.readonly
+            assert len(view) == channel.chunk_elems(i)
+
+            chunk = np.asarray(view)
+            assert chunk.dtype == dtype
+            assert (chunk == dtype(i % 100)).all()
+            if i < 4:
+                views.append(view)
+
+        # Views must stay valid and unchanged while being held on to, even after many more calls.
+        for i, view in enumerate(views):
+            assert (np.asarray(view) == dtype(i % 100)).all()
+
+    def test_get_chunk_view_reuse(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+        _write_indexed_chunks(channel, channel.set_chunk)
+
+        def address(view: memoryview) -> int:
+            return np.asarray(view).__array_interface__["data"][0]
+
+        # Holding on to several views at once requires a separate arena for each of them.
+        views = [channel.get_chunk_view(i) for i in range(4)]
+        addresses = {address(view) for view in views}
+        assert len(addresses) == len(views)
+        del views
+
+        # Once dropped, the arenas that are kept around get reused rather than allocating new ones.
+        first = channel.get_chunk_view(0)
+        second = channel.get_chunk_view(1)
+        assert address(first) in addresses
+        assert address(second) in addresses
+        assert (np.asarray(first) == dtype(0)).all()
+        assert (np.asarray(second) == dtype(1)).all()
+
+    def test_chunk_writer(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+        writer = channel.chunk_writer()
+        _write_indexed_chunks(channel, writer)
+
+        for i in range(channel.num_chunks()):
+            chunk = channel.get_chunk(i)
+            assert chunk.dtype == dtype
+            assert (chunk == dtype(i % 100)).all()
+
+        # Equivalent dtypes which are not the canonical dtype instance must also be accepted
+        metadata_dtype = np.dtype(dtype, metadata={"key": "value"})
+        writer(0, np.full((channel.chunk_elems(0),), 7, metadata_dtype))
+        assert (channel.get_chunk(0) == dtype(7)).all()
+
+        # Invalid chunk index
+        with pytest.raises(IndexError):
+            writer(channel.num_chunks(), np.zeros((width,), dtype))
+        # Incorrect number of elements
+        with pytest.raises(ValueError):
+            writer(0, np.zeros((width + 20,), dtype))
+        # Invalid shape dimensions but correct number of elements
+        with pytest.raises(ValueError):
+            writer(0, np.zeros((width, 1), dtype))
+
+    def test_get_chunks_batch(self, width: int, height: int, dtype: npt.DTypeLike):
+        channel = _scanline_channel(dtype, width, height)
+        _write_indexed_chunks(channel, channel.set_chunk)
+
+        indices = list(range(0, channel.num_chunks(), 2))
+        chunks = channel.get_chunks_batch(indices)
+        assert len(chunks) == len(indices)
+        for i, chunk in zip(indices, chunks):
+            assert chunk.dtype == dtype
+            assert chunk.shape == (channel.chunk_elems(i),)
+            assert (chunk == dtype(i % 100)).all()
+
+        # Invalid chunk index
+        with pytest.raises(IndexError):
+            channel.get_chunks_batch([0, channel.num_chunks()])
@@ -1,17 +1,29 @@
-import os
 import gc
+import pathlib
 
 import pytest
 
-from typing import Tuple
+from typing import Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
 
 import compressed_image as compressed
 
-# The base dir to the cpp test images, so we don't have to copy them over to our python test suite.
-_BASE_IMAGE_PATH_ABS = os.path.join(os.path.dirname(__file__), "../../test/images")
+
+# Sentinel arrays of an unsupported dtype, these are only used to trigger errors and never read so we allocate 
+# them once without initializing them.
+_BOOL_64x64 = np.empty((64, 64), dtype=np.bool_)
+_BOOL_64x32 = np.empty((64, 32), dtype=np.bool_)
+_BOOL_32x64 = np.empty((32, 64), dtype=np.bool_)
+
+
+def _all_equal(array: np.ndarray, value: Union[int, float]) -> bool:
+    """
+    Check whether all elements of `array` equal `value` using a min/max reduction, unlike `np.all(array == value)`
+    this doesn't allocate a full-size boolean temporary.
+    """
+    return array.min() == value and array.max() == value
 
 
 class TestCompressedImage:
@@ -24,8 +36,8 @@ class TestCompressedImage:
         print(image.get_metadata())
         assert image.get_metadata() == {"my_key": "my_val"}
 
-    def test_modify_channelnames(self):
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_1920x1080.exr")
+    def test_modify_channelnames(self, images_dir: pathlib.Path):
+        img_path = str(images_dir / "multilayer_1920x1080.exr")
         image = compressed.Image.read(np.float16, img_path, subimage = 0, channel_names = ["R", "G", "B", "A"])
 
         with pytest.raises(ValueError):
@@ -35,20 +47,18 @@ class TestCompressedImage:
             # Incorrect type
             image.set_channel_names([1, 2, 3, 4])
 
-        # modify in place
-        chnames = image.get_channel_names()
         chnames = ["red", "G", "B", "A"]
         image.set_channel_names(chnames)
         assert image.get_channel_names() == chnames
 
-    def test_dtype_from_file(self):
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_1920x1080.exr")
+    def test_dtype_from_file(self, images_dir: pathlib.Path):
+        img_path = str(images_dir / "multilayer_1920x1080.exr")
         dtype = compressed.Image.dtype_from_file(img_path)
 
         assert dtype == np.dtype(np.float32)
         
-    def test_dtypes_from_file_multi_dtype(self):
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_1920x1080.exr")
+    def test_dtypes_from_file_multi_dtype(self, images_dir: pathlib.Path):
+        img_path = str(images_dir / "multilayer_1920x1080.exr")
         dtypes = compressed.Image.dtypes_from_file(img_path)
 
         print(dtypes)
@@ -71,9 +81,11 @@ class TestCompressedImage:
         ]
 
 
-# Parametrize over all supported dtypes by compressed.Image
-@pytest.mark.parametrize("dtype", 
-    [
+# Parametrize over all supported dtypes by compressed.Image. This is a class-scoped fixture rather than a 
+# parametrize mark so that all tests of a dtype run back-to-back.
+@pytest.fixture(
+    scope="class",
+    params=[
         np.uint8, 
         np.int8, 
         np.uint16, 
@@ -82,15 +94,19 @@ class TestCompressedImage:
         np.int32,
         np.float16,
         np.float32
-    ]
+    ],
+    ids=lambda dtype: np.dtype(dtype).name
 )
+def dtype(request: pytest.FixtureRequest) -> npt.DTypeLike:
+    return request.param
+
+
 class TestCompressedImageParametrized:
 
-    def test_read_overloads(self, dtype: npt.DTypeLike):
+    def test_read_overloads(self, dtype: npt.DTypeLike, images_dir: pathlib.Path):
+        img_path = str(images_dir / "multilayer_2560x1440.exr")
 
         # This image is a single subimage but with a total of 23 channels
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_2560x1440.exr")
-
         # Read all channels from subimage 0
         image_all_channels = compressed.Image.read(dtype, img_path, subimage = 0)
 
@@ -100,15 +116,13 @@ class TestCompressedImageParametrized:
         # Read only R, G, B, A channels from subimage 0 but now by name
         image_rgba_names = compressed.Image.read(dtype, img_path, subimage = 0, channel_names = ["R", "G", "B", "A"])
 
-        assert np.array_equal(image_all_channels[0].get_decompressed(), image_rgba_indices[0].get_decompressed())
-        assert np.array_equal(image_all_channels[1].get_decompressed(), image_rgba_indices[1].get_decompressed())
-        assert np.array_equal(image_all_channels[2].get_decompressed(), image_rgba_indices[2].get_decompressed())
-        assert np.array_equal(image_all_channels[3].get_decompressed(), image_rgba_indices[3].get_decompressed())
+        # Decompress each channel only once and reuse it for all the comparisons.
+        rgba_all = [image_all_channels[i].get_decompressed() for i in range(4)]
+        rgba_indices = [image_rgba_indices[i].get_decompressed() for i in range(4)]
+        rgba_names = [image_rgba_names[i].get_decompressed() for i in range(4)]
 
-        assert np.array_equal(image_all_channels[0].get_decompressed(), image_rgba_names[0].get_decompressed())
-        assert np.array_equal(image_all_channels[1].get_decompressed(), image_rgba_names[1].get_decompressed())
-        assert np.array_equal(image_all_channels[2].get_decompressed(), image_rgba_names[2].get_decompressed())
-        assert np.array_equal(image_all_channels[3].get_decompressed(), image_rgba_names[3].get_decompressed())
+        assert all(np.array_equal(ref, other) for ref, other in zip(rgba_all, rgba_indices))
+        assert all(np.array_equal(ref, other) for ref, other in zip(rgba_all, rgba_names))
 
         assert len(image_all_channels) == 23
         assert len(image_rgba_indices) == 4
@@ -118,10 +132,11 @@ class TestCompressedImageParametrized:
         assert image_rgba_indices.shape == (4, 1440, 2560)
         assert image_rgba_names.shape == (4, 1440, 2560)
 
-        assert image_rgba_indices.get_channel_names() == ["R", "G", "B", "A"]
-        assert image_rgba_names.get_channel_names() == ["R", "G", "B", "A"]
+        expected_names = ["R", "G", "B", "A"]
+        assert image_rgba_indices.get_channel_names() == expected_names
+        assert image_rgba_names.get_channel_names() == expected_names
 
-    def test_aliasing_pointer_lifetime(self, dtype: npt.DTypeLike):
+    def test_aliasing_pointer_lifetime(self, dtype: npt.DTypeLike, images_dir: pathlib.Path):
         # This is something the average python dev will not have to worry about
         # but because when we construct our dynamic_channel from our dynamic_image
         # we create a shared_ptr pointing to a compressed::channel<T> but with
@@ -134,7 +149,7 @@ class TestCompressedImageParametrized:
             return img[0]
 
         # This image is a single subimage but with a total of 23 channels
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_2560x1440.exr")
+        img_path = str(images_dir / "multilayer_2560x1440.exr")
         channel = get_channel(path=img_path)
 
         # This should not clean up the image as we still hold an implicit reference to it.
@@ -143,19 +158,17 @@ class TestCompressedImageParametrized:
         img_data = channel.get_decompressed()
         assert channel.shape == (1440, 2560)
       
-    def test_chunk_size_guarantee(self, dtype: npt.DTypeLike):
-
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_1920x1080.exr")
-        image = compressed.Image.read(dtype, img_path, subimage = 0)
+    def test_chunk_size_guarantee(self, dtype: npt.DTypeLike, read_image_cached):
+        image = read_image_cached(dtype, "multilayer_1920x1080.exr", subimage = 0)
 
         image_chunk_size = image.chunk_size()
 
         for channel in image.channels():
             assert channel.chunk_size() == image_chunk_size
 
-    def test_channel_num(self, dtype: npt.DTypeLike):
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_1920x1080.exr")
-        image = compressed.Image.read(np.float16, img_path, subimage = 0, channel_names = ["R", "G", "B", "A"])
+    def test_channel_num(self, dtype: npt.DTypeLike, images_dir: pathlib.Path):
+        img_path = str(images_dir / "multilayer_1920x1080.exr")
+        image = compressed.Image.read(dtype, img_path, subimage = 0, channel_names = ["R", "G", "B", "A"])
 
         assert image.num_channels == 4
         assert image.get_channel_index("R") == 0
@@ -169,61 +182,112 @@ class TestCompressedImageParametrized:
         (123, 456),
         (2048, 16),
         (1920, 1080),
-        (4096, 4096),
+        pytest.param(4096, 4096, marks=pytest.mark.slow),
     ])
     def test_add_channel(self, dtype: npt.DTypeLike, width: int, height: int):
         image = compressed.Image(dtype, [], width, height)
 
+        # The channel data is copied on insertion so we can reuse the same array for all channels. We can't use
+        # np.broadcast_to here as the bindings require the data to be contiguous.
+        data = np.full((height, width), 90, dtype)
         for i in range(4):
-            image.add_channel(np.full((height, width), 90, dtype), width, height)
+            image.add_channel(data, width, height)
 
         assert image.num_channels == 4
-        assert np.all(image[0].get_decompressed() == 90)
-        assert np.all(image[1].get_decompressed() == 90)
-        assert np.all(image[2].get_decompressed() == 90)
-        assert np.all(image[3].get_decompressed() == 90)
+        assert _all_equal(image[0].get_decompressed(), 90)
+        assert _all_equal(image[1].get_decompressed(), 90)
+        assert _all_equal(image[2].get_decompressed(), 90)
+        assert _all_equal(image[3].get_decompressed(), 90)
+
+    def test_add_channels(self, dtype: npt.DTypeLike):
+        image = compressed.Image(dtype, [], 64, 64)
+
+        red = np.full((64, 64), 90, dtype)
+        green = np.full((64, 64), 25, dtype)
+        image.add_channels([red, green], 64, 64, ["R", "G"])
+
+        assert image.num_channels == 2
+        assert image.get_channel_names() == ["R", "G"]
+        assert _all_equal(image[0].get_decompressed(), 90)
+        assert _all_equal(image[1].get_decompressed(), 25)
+
+    def test_add_channels_invalid(self, dtype: npt.DTypeLike):
+        image = compressed.Image(dtype, [], 64, 64)
+        data = np.full((64, 64), 90, dtype)
+
+        # Mismatched dtype
+        with pytest.raises(ValueError):
+            image.add_channels([data, _BOOL_64x64], 64, 64)
+        # Wrong number of dimensions
+        with pytest.raises(ValueError):
+            image.add_channels([data, data.reshape(-1)], 64, 64)
+        # Mismatched number of names
+        with pytest.raises(ValueError):
+            image.add_channels([data, data], 64, 64, ["R"])
+        # Array size not matching the passed dimensions
+        with pytest.raises(ValueError):
+            image.add_channels([data, np.full((32, 64), 90, dtype)], 64, 64)
+        # Dimensions not matching the image
+        with pytest.raises(ValueError):
+            image.add_channels([np.full((32, 32), 90, dtype)] * 2, 32, 32)
+
+        # None of the channels may have been inserted
+        assert image.num_channels == 0
 
     def test_add_channel_named(self, dtype: npt.DTypeLike):
         image = compressed.Image(dtype, [], 64, 64)
 
-        image.add_channel(np.full((64, 64), 90, dtype), 64, 64, "R")
-        image.add_channel(np.full((64, 64), 90, dtype), 64, 64, "G")
-        image.add_channel(np.full((64, 64), 90, dtype), 64, 64, "B")
-        image.add_channel(np.full((64, 64), 90, dtype), 64, 64, "A")
+        data = np.full((64, 64), 90, dtype)
+        image.add_channel(data, 64, 64, "R")
+        image.add_channel(data, 64, 64, "G")
+        image.add_channel(data, 64, 64, "B")
+        image.add_channel(data, 64, 64, "A")
 
         assert image.num_channels == 4
         assert image.get_channel_names() == ["R", "G", "B", "A"]
-        assert np.all(image[0].get_decompressed() == 90)
-        assert np.all(image[1].get_decompressed() == 90)
-        assert np.all(image[2].get_decompressed() == 90)
-        assert np.all(image[3].get_decompressed() == 90)
+        assert _all_equal(image[0].get_decompressed(), 90)
+        assert _all_equal(image[1].get_decompressed(), 90)
+        assert _all_equal(image[2].get_decompressed(), 90)
+        assert _all_equal(image[3].get_decompressed(), 90)
+
+    def test_add_channel_full(self, dtype: npt.DTypeLike):
+        image = compressed.Image(dtype, [], 64, 64)
+
+        image.add_channel_full(90, "R")
+        image.add_channel_full(25, "G")
+
+        assert image.num_channels == 2
+        assert image.get_channel_names() == ["R", "G"]
+        assert image[0].shape == (64, 64)
+        assert _all_equal(image[0].get_decompressed(), 90)
+        assert _all_equal(image[1].get_decompressed(), 25)
 
     def test_add_channel_invalid_dtype(self, dtype: npt.DTypeLike):
         image = compressed.Image(dtype, [], 64, 64)
 
-        # We don't and wont support np.bool as its not a typical image format.
+        # We don't and wont support np.bool_ as its not a typical image format.
         with pytest.raises(ValueError):
-            image.add_channel(np.full((64, 64), 90, np.bool), 64, 64)
+            image.add_channel(_BOOL_64x64, 64, 64)
 
     def test_add_channel_invalid_dimensions(self, dtype: npt.DTypeLike):
         image = compressed.Image(dtype, [], 64, 64)
 
         # Invalid passed width
         with pytest.raises(ValueError):
-            image.add_channel(np.full((64, 64), 90, np.bool), 32, 64)
+            image.add_channel(_BOOL_64x64, 32, 64)
         # Invalid passed height
         with pytest.raises(ValueError):
-            image.add_channel(np.full((64, 64), 90, np.bool), 64, 32)
+            image.add_channel(_BOOL_64x64, 64, 32)
 
         # Invalid np array width
         with pytest.raises(ValueError):
-            image.add_channel(np.full((64, 32), 90, np.bool), 64, 64)
+            image.add_channel(_BOOL_64x32, 64, 64)
         # Invalid np array height
         with pytest.raises(ValueError):
-            image.add_channel(np.full((32, 64), 90, np.bool), 64, 64)
+            image.add_channel(_BOOL_32x64, 64, 64)
 
-    def test_remove_channel(self, dtype: npt.DTypeLike):
-        img_path = os.path.join(_BASE_IMAGE_PATH_ABS, "multilayer_1920x1080.exr")
+    def test_remove_channel(self, dtype: npt.DTypeLike, images_dir: pathlib.Path):
+        img_path = str(images_dir / "multilayer_1920x1080.exr")
         image = compressed.Image.read(np.float16, img_path, subimage = 0, channel_names = ["R", "G", "B", "A"])
 
         image.remove_channel("R")
@@ -232,4 +296,19 @@ class TestCompressedImageParametrized:
 
         assert len(image) == 2
         assert image.get_channel_names() == ["G", "A"]
-        assert image.num_channels == 2
\ No newline at end of file
+        assert image.num_channels == 2
+
+    def test_read_mmap(self, dtype: npt.DTypeLike, images_dir: pathlib.Path, read_image_cached):
+        images = {
+            # Also read by test_chunk_size_guarantee so this goes through the cache.
+            "multilayer_1920x1080.exr": read_image_cached(dtype, "multilayer_1920x1080.exr", subimage = 0),
+            "uv_grid_2048x2048.jpg": compressed.Image.read(dtype, str(images_dir / "uv_grid_2048x2048.jpg"), subimage = 0),
+        }
+        for name, image in images.items():
+            img_path = str(images_dir / name)
+            image_mmap = compressed.Image.read_mmap(dtype, img_path, subimage = 0)
+
+            assert image_mmap.shape == image.shape
+            assert image_mmap.get_channel_names() == image.get_channel_names()
+            for channel, channel_mmap in zip(image.channels(), image_mmap.channels()):
+                assert np.array_equal(channel.get_decompressed(), channel_mmap.get_decompressed())
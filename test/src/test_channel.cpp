@@ -123,4 +123,50 @@ TEST_CASE("Channel iterate")
 			}
 		}
 	}
-}
\ No newline at end of file
+}
+
+// -----------------------------------------------------------------------------------
+// -----------------------------------------------------------------------------------
+TEST_CASE("Channel fill")
+{
+	auto vec = std::vector<uint8_t>(8192);
+	std::iota(vec.begin(), vec.end(), 0);
+
+	auto channel = compressed::channel<uint8_t>(std::span<uint8_t>(vec), 128, 64, compressed::enums::codec::lz4, 9, 128, 4096);
+	channel.fill(25);
+
+	CHECK(channel.num_chunks() == 2);
+	CHECK(channel.chunk_size() == 4096);
+	CHECK(channel.uncompressed_size() == 8192);
+
+	auto decompressed = channel.get_decompressed();
+	CHECK(decompressed == std::vector<uint8_t>(8192, 25));
+}
+
+
+// -----------------------------------------------------------------------------------
+// -----------------------------------------------------------------------------------
+TEST_CASE("Channel lazy constant")
+{
+	SUBCASE("Full channel")
+	{
+		auto channel = compressed::channel<uint16_t>::full(128, 64, 25, compressed::enums::codec::lz4, 9, 128, 4096);
+		CHECK(channel.lazy_constant() == uint16_t{ 25 });
+		CHECK(channel.get_decompressed() == std::vector<uint16_t>(128 * 64, 25));
+	}
+
+	SUBCASE("Modified chunk")
+	{
+		auto channel = compressed::channel<uint16_t>::full(128, 64, 25, compressed::enums::codec::lz4, 9, 128, 4096);
+		auto chunk = std::vector<uint16_t>(channel.chunk_elems(0), 12);
+		channel.set_chunk(std::span<uint16_t>(chunk), 0);
+		CHECK(!channel.lazy_constant().has_value());
+	}
+
+	SUBCASE("Compressed channel")
+	{
+		auto vec = std::vector<uint16_t>(128 * 64, 25);
+		auto channel = compressed::channel<uint16_t>(std::span<uint16_t>(vec), 128, 64);
+		CHECK(!channel.lazy_constant().has_value());
+	}
+}
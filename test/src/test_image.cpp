@@ -856,4 +856,89 @@ TEST_CASE("Zip modify image channels larger to chunk size parametrized")
 			}
 		}
 	);
-}
\ No newline at end of file
+}
+
+// -----------------------------------------------------------------------------------
+// -----------------------------------------------------------------------------------
+TEST_CASE("Read compressed file memory-mapped")
+{
+	for (std::string name : { "uv_grid_2048x2048.jpg", "multilayer_1920x1080.exr" })
+	{
+		auto path = std::filesystem::current_path() / "images" / name;
+
+		auto image = compressed::image<uint8_t>::read_mmap(path);
+		auto image_data = image.get_decompressed();
+		auto image_ref = test_util::read_oiio<uint8_t>(path);
+
+		test_util::compare_images(image_data, image_ref, name);
+	}
+}
+
+// -----------------------------------------------------------------------------------
+// -----------------------------------------------------------------------------------
+TEST_CASE("Add multiple channels parametrized")
+{
+	test_util::parametrize<uint8_t, uint16_t, uint32_t, float>([&]<typename T>([[maybe_unused]] T type)
+		{
+			auto channel_r_data = std::vector<T>(128, static_cast<T>(255));
+			auto channel_g_data = std::vector<T>(128, static_cast<T>(128));
+
+			auto image = compressed::image<T>(
+				std::vector<std::vector<T>>{ channel_r_data },
+				16,
+				8,
+				std::vector<std::string>{ "R" }
+			);
+
+			SUBCASE("Valid")
+			{
+				image.add_channels(
+					{ std::span<const T>(channel_g_data), std::span<const T>(channel_r_data) },
+					16,
+					8,
+					{ "G", "B" }
+				);
+
+				CHECK(image.num_channels() == 3);
+				CHECK(image.channelnames() == std::vector<std::string>{ "R", "G", "B" });
+				CHECK(image.channel(1).get_decompressed() == channel_g_data);
+				CHECK(image.channel(2).get_decompressed() == channel_r_data);
+			}
+
+			SUBCASE("Invalid")
+			{
+				// Mismatched number of names
+				CHECK_THROWS_AS(
+					image.add_channels({ std::span<const T>(channel_g_data) }, 16, 8, { "G", "B" }),
+					std::invalid_argument
+				);
+				// Mismatched dimensions
+				CHECK_THROWS_AS(
+					image.add_channels({ std::span<const T>(channel_g_data) }, 8, 16),
+					std::invalid_argument
+				);
+				// Image must be left untouched
+				CHECK(image.num_channels() == 1);
+			}
+
+			SUBCASE("Precompressed")
+			{
+				auto channels = compressed::image<T>::compress_channels(
+					{ std::span<const T>(channel_g_data), std::span<const T>(channel_r_data) }, 16, 8
+				);
+				REQUIRE(channels.size() == 2);
+				image.add_channels(std::move(channels), { "G", "B" });
+
+				CHECK(image.num_channels() == 3);
+				CHECK(image.channelnames() == std::vector<std::string>{ "R", "G", "B" });
+				CHECK(image.channel(1).get_decompressed() == channel_g_data);
+				CHECK(image.channel(2).get_decompressed() == channel_r_data);
+
+				// Mismatched dimensions
+				auto mismatched = compressed::image<T>::compress_channels({ std::span<const T>(channel_g_data) }, 8, 16);
+				CHECK_THROWS_AS(image.add_channels(std::move(mismatched)), std::invalid_argument);
+				CHECK(image.num_channels() == 3);
+			}
+		}
+	);
+}
@@ -72,4 +72,29 @@ TEST_CASE("Schunk: initialize with data")
 				CHECK(chunk.size() == 256 / sizeof(T));
 			}
 		});
-}
\ No newline at end of file
+}
+
+// -----------------------------------------------------------------------------------
+// -----------------------------------------------------------------------------------
+TEST_CASE("Schunk: initialize with repeated value")
+{
+	test_util::parametrize<uint8_t, uint16_t, uint32_t, float>([&]<typename T>([[maybe_unused]] T type)
+		{
+			std::vector<T> data(4096, static_cast<T>(25));
+
+			auto ctx = compressed::blosc2::create_compression_context<T>(
+				std::thread::hardware_concurrency(), 
+				compressed::enums::codec::lz4, 
+				9,
+				128
+			);
+			compressed::blosc2::schunk<T> super_chunk(std::span<const T>(data), 64, 256 * sizeof(T), ctx);
+
+			// Every chunk should be stored as a single repeated value, i.e. a blosc2 header + sizeof(T).
+			CHECK(super_chunk.csize() == super_chunk.num_chunks() * (BLOSC_EXTENDED_HEADER_LENGTH + sizeof(T)));
+
+			auto decomp_ctx = compressed::blosc2::create_decompression_context(std::thread::hardware_concurrency());
+			auto decompressed = super_chunk.to_uncompressed(decomp_ctx);
+			CHECK(decompressed == data);
+		});
+}